@@ -1,11 +1,19 @@
 """FastAPI application exposing the YouTube interaction system as a REST API."""
 
+from typing import AsyncIterator, List
+
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from src.core.chain import create_chain, invoke_chain
-from src.core.models import QueryRequest
+from src.core.chain import (
+    create_chain, create_streaming_chain, ainvoke_chain, ainvoke_chain_many,
+    ainvoke_chain_stream
+)
+from src.core.models import QueryRequest, BatchQueryRequest
+from src.tools.http import close_session
 from src.utils.logging import setup_logging, get_logger
+from src.utils.serialization import dumps_json
 from src.config.settings import get_settings
 
 
@@ -18,6 +26,12 @@ class QueryResponse(BaseModel):
     result: str
 
 
+class BatchQueryResponse(BaseModel):
+    """Response model for batched chain queries."""
+
+    results: List[str]
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     settings = get_settings()
@@ -38,10 +52,17 @@ def create_app() -> FastAPI:
         logger.info("Starting up YouTube Interaction API")
         # Create and cache the chain on the app state so it can be reused per process
         app.state.chain = create_chain()
+        app.state.streaming_chain = create_streaming_chain()
         logger.info("Chain initialized and cached on app state")
 
+    @app.on_event("shutdown")
+    def _shutdown() -> None:
+        """Release shared resources on shutdown."""
+        logger.info("Shutting down YouTube Interaction API")
+        close_session()
+
     @app.post("/query", response_model=QueryResponse, summary="Process a query")
-    def process_query(request: QueryRequest) -> QueryResponse:
+    async def process_query(request: QueryRequest) -> QueryResponse:
         """
         Process a YouTube-related query using the universal chain.
 
@@ -49,19 +70,55 @@ def create_app() -> FastAPI:
         includes the final text result produced by the chain.
         """
         try:
-            chain = getattr(app.state, "chain", None)
-            if chain is None:
-                logger.warning("Chain not initialized on app state; creating a new one")
-                chain = create_chain()
-                app.state.chain = chain
+            chain = app.state.chain
 
             logger.info("Processing query via HTTP API")
-            result_text = invoke_chain(chain, request.query)
+            result_text = await ainvoke_chain(chain, request.query)
             return QueryResponse(result=result_text)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("Error while processing query via API", exc_info=True)
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+    @app.post("/query/batch", response_model=BatchQueryResponse, summary="Process several queries")
+    async def process_query_batch(request: BatchQueryRequest) -> BatchQueryResponse:
+        """
+        Process several YouTube-related queries concurrently.
+
+        The request body should contain a `queries` list. The response contains
+        one result string per query, in the same order.
+        """
+        try:
+            chain = app.state.chain
+
+            logger.info(f"Processing {len(request.queries)} queries via HTTP API")
+            results = await ainvoke_chain_many(chain, request.queries)
+            return BatchQueryResponse(results=results)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error("Error while processing query batch via API", exc_info=True)
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @app.post("/query/stream", summary="Process a query and stream the response")
+    async def process_query_stream(request: QueryRequest) -> StreamingResponse:
+        """
+        Process a YouTube-related query and stream the response as server-sent events.
+
+        Each `data` event carries a JSON-encoded text chunk. The stream ends with
+        an `end` event, or an `error` event if processing fails mid-stream.
+        """
+        chain = app.state.streaming_chain
+
+        async def _events() -> AsyncIterator[str]:
+            try:
+                async for chunk in ainvoke_chain_stream(chain, request.query):
+                    yield f"data: {dumps_json(chunk)}\n\n"
+                yield "event: end\ndata: {}\n\n"
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.error("Error while streaming query via API", exc_info=True)
+                yield f"event: error\ndata: {dumps_json({'detail': str(exc)})}\n\n"
+
+        logger.info("Streaming query via HTTP API")
+        return StreamingResponse(_events(), media_type="text/event-stream")
+
     @app.get("/health", summary="Health check")
     def health_check() -> dict:
         """Simple health check endpoint."""
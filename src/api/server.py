@@ -0,0 +1,56 @@
+"""Production entry point for serving the FastAPI application with Uvicorn."""
+
+import argparse
+import importlib.util
+import sys
+
+import uvicorn
+
+
+def _select_loop() -> str:
+    """Use uvloop where it is available; it does not support Windows."""
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        return "uvloop"
+    return "asyncio"
+
+
+def _select_http() -> str:
+    """Use the httptools parser when installed, falling back to h11."""
+    if importlib.util.find_spec("httptools") is not None:
+        return "httptools"
+    return "h11"
+
+
+def main() -> int:
+    """
+    Run the API server.
+    
+    Returns:
+        Exit code (0 for success)
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve the YouTube interaction HTTP API"
+    )
+    parser.add_argument("--host", type=str, default="0.0.0.0", help="Bind address")
+    parser.add_argument("--port", type=int, default=8000, help="Bind port")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes"
+    )
+    args = parser.parse_args()
+    
+    uvicorn.run(
+        "src.api.app:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=_select_loop(),
+        http=_select_http()
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 """Application configuration management using Pydantic settings."""
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache
 from typing import Optional
 
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -15,6 +17,19 @@ class Settings(BaseSettings):
     model_provider: str = "google_genai"
     log_level: str = "INFO"
     
+    # Tool execution limits
+    max_tool_concurrency: int = 8
+    tool_rpm: int = 300
+    
+    # yt-dlp metadata disk cache
+    yt_cache_dir: str = "~/.cache/youtube-interaction"
+    yt_cache_disable: bool = False
+    # Persist cacheable tool results next to the yt-dlp cache across restarts
+    yt_tool_disk_cache: bool = False
+    
+    # Shared transcript cache; an in-process cache is used when unset
+    redis_url: Optional[str] = None
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -28,14 +43,9 @@ class Settings(BaseSettings):
             raise ValueError("GOOGLE_API_KEY environment variable is required")
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get or create the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-        _settings.validate_api_key()
-    return _settings
+    settings = Settings()
+    settings.validate_api_key()
+    return settings
@@ -1,22 +1,37 @@
 """Chain construction and orchestration."""
 
+import asyncio
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Tuple
+
 from langchain.chat_models import init_chat_model
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableLambda, Runnable
 from langchain_core.language_models import BaseChatModel
+from langchain_core.tools import BaseTool
 
 from src.config.settings import get_settings
-from src.tools.registry import get_all_tools
-from src.processing.executor import create_recursive_chain
+from src.core.constants import ModelConfig, ProcessingConfig
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Tool-bound LLMs keyed on (id(llm), tool names); the LLM is kept in the value
+# so its id cannot be recycled while the entry is alive
+_BOUND_LLMS: Dict[Tuple[int, Tuple[str, ...]], Tuple[BaseChatModel, Runnable]] = {}
+
+# The system prompt never changes, so one message instance is shared by every query
+_SYSTEM_MESSAGE = SystemMessage(content=ModelConfig.SYSTEM_PROMPT)
+
 
+@lru_cache(maxsize=1)
 def create_llm() -> BaseChatModel:
     """
     Create and configure the LLM instance.
     
+    The instance is cached, since model initialization performs credential and
+    HTTP client setup that is expensive to repeat.
+    
     Returns:
         Configured LLM instance with tools bound
     """
@@ -32,14 +47,32 @@ def create_llm() -> BaseChatModel:
     return llm
 
 
-def create_chain() -> Runnable:
+def _bind_tools(llm: BaseChatModel, tools: List[BaseTool]) -> Runnable:
     """
-    Create the universal chain for processing queries with tool calling.
+    Bind tools to an LLM, reusing a previous binding of the same tool set.
+    
+    Args:
+        llm: LLM instance to bind tools to
+        tools: Tools to bind
     
     Returns:
-        Runnable chain that processes queries and executes tools recursively
+        LLM runnable with tools bound
     """
-    logger.info("Creating universal chain")
+    key = (id(llm), tuple(tool.name for tool in tools))
+    cached = _BOUND_LLMS.get(key)
+    if cached is not None:
+        return cached[1]
+    
+    llm_with_tools = llm.bind_tools(tools)
+    _BOUND_LLMS[key] = (llm, llm_with_tools)
+    return llm_with_tools
+
+
+def _create_llm_with_tools() -> Runnable:
+    """Create the LLM and bind every registered tool to it."""
+    # Imported here rather than at module level: the tools package imports
+    # src.core.constants, so a top-level import would make src.core cyclic
+    from src.tools.registry import get_all_tools
     
     # Initialize LLM
     llm = create_llm()
@@ -49,22 +82,69 @@ def create_chain() -> Runnable:
     logger.info(f"Binding {len(tools)} tools to LLM")
     
     # Bind tools to LLM
-    llm_with_tools = llm.bind_tools(tools)
+    return _bind_tools(llm, tools)
+
+
+def _to_messages(x: dict) -> list:
+    """Build the initial message history for a query."""
+    return [_SYSTEM_MESSAGE, HumanMessage(content=x["query"])]
+
+
+def create_chain() -> Runnable:
+    """
+    Create the universal chain for processing queries with tool calling.
     
-    # Create recursive chain for tool execution
-    recursive_chain = create_recursive_chain(llm_with_tools)
+    Returns:
+        Runnable chain that processes queries and executes tools recursively
+    """
+    from src.processing.executor import _recursive_chain, _recursive_chain_async
     
-    # Build the universal chain
-    universal_chain = (
-        RunnableLambda(lambda x: [HumanMessage(content=x["query"])])
-        | RunnableLambda(lambda messages: messages + [llm_with_tools.invoke(messages)])
-        | recursive_chain
-    )
+    logger.info("Creating universal chain")
+    
+    llm_with_tools = _create_llm_with_tools()
+    
+    def _run(x: dict) -> list:
+        messages = _to_messages(x)
+        messages.append(llm_with_tools.invoke(messages))
+        return _recursive_chain(messages, llm_with_tools)
+    
+    async def _arun(x: dict) -> list:
+        messages = _to_messages(x)
+        messages.append(await llm_with_tools.ainvoke(messages))
+        return await _recursive_chain_async(messages, llm_with_tools)
+    
+    # A single runnable rather than a pipeline of trivial stages, so each
+    # invocation pays for one Runnable dispatch instead of three; the native
+    # async implementation keeps ainvoke off worker threads
+    universal_chain = RunnableLambda(_run, afunc=_arun)
     
     logger.info("Universal chain created successfully")
     return universal_chain
 
 
+def create_streaming_chain() -> Runnable:
+    """
+    Create an async-only chain that streams the response text.
+    
+    Tool calls are executed as in create_chain, but every LLM turn is streamed,
+    so astream yields text chunks as soon as the model produces them.
+    
+    Returns:
+        Runnable whose astream yields response text chunks
+    """
+    from src.processing.executor import astream_recursive_chain
+    
+    logger.info("Creating streaming chain")
+    
+    llm_with_tools = _create_llm_with_tools()
+    
+    async def _astream(x: dict) -> AsyncIterator[str]:
+        async for text in astream_recursive_chain(_to_messages(x), llm_with_tools):
+            yield text
+    
+    return RunnableLambda(_astream)
+
+
 def invoke_chain(chain: Runnable, query: str) -> str:
     """
     Invoke the chain with a query and return the final response text.
@@ -85,6 +165,82 @@ def invoke_chain(chain: Runnable, query: str) -> str:
     result = chain.invoke(query_dict)
     
     # Extract text from the last message
+    return _extract_response_text(result)
+
+
+async def ainvoke_chain(chain: Runnable, query: str) -> str:
+    """
+    Asynchronously invoke the chain with a query and return the final response text.
+    
+    Args:
+        chain: The chain to invoke
+        query: User query string
+    
+    Returns:
+        Final response text from the chain
+    
+    Raises:
+        Exception: If chain execution fails
+    """
+    logger.info(f"Invoking chain asynchronously with query: {query[:100]}...")
+    
+    result = await chain.ainvoke({"query": query})
+    
+    return _extract_response_text(result)
+
+
+async def ainvoke_chain_many(
+    chain: Runnable,
+    queries: List[str],
+    concurrency: int = ProcessingConfig.MAX_CONCURRENT_QUERIES
+) -> List[str]:
+    """
+    Asynchronously invoke the chain for several queries concurrently.
+    
+    Args:
+        chain: The chain to invoke
+        queries: User query strings
+        concurrency: Maximum number of queries in flight at once
+    
+    Returns:
+        Final response texts, in the same order as queries
+    
+    Raises:
+        Exception: If any chain execution fails
+    """
+    logger.info(f"Invoking chain for {len(queries)} queries (concurrency={concurrency})")
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _run(query: str) -> str:
+        async with semaphore:
+            return await ainvoke_chain(chain, query)
+    
+    return list(await asyncio.gather(*[_run(q) for q in queries]))
+
+
+async def ainvoke_chain_stream(chain: Runnable, query: str) -> AsyncIterator[str]:
+    """
+    Invoke a streaming chain with a query and yield response text as it arrives.
+    
+    Args:
+        chain: Chain created by create_streaming_chain
+        query: User query string
+    
+    Yields:
+        Response text chunks
+    
+    Raises:
+        Exception: If chain execution fails
+    """
+    logger.info(f"Streaming chain with query: {query[:100]}...")
+    
+    async for chunk in chain.astream({"query": query}):
+        yield chunk
+
+
+def _extract_response_text(result: list) -> str:
+    """Extract the final response text from a chain result."""
     if result and len(result) > 0:
         last_message = result[-1]
         response_text = getattr(last_message, 'content', str(last_message))
@@ -1,5 +1,6 @@
 """Application constants."""
 
+import re
 from typing import List
 
 
@@ -8,6 +9,10 @@ class ModelConfig:
     
     DEFAULT_MODEL = "gemini-3-pro-preview"
     DEFAULT_PROVIDER = "google_genai"
+    SYSTEM_PROMPT = (
+        "When a request needs several independent tool lookups, call batch_tool "
+        "once with all of them instead of calling tools one at a time."
+    )
 
 
 class LoggingConfig:
@@ -15,6 +20,8 @@ class LoggingConfig:
     
     DEFAULT_LEVEL = "INFO"
     THIRD_PARTY_LOGGERS: List[str] = ["pytube", "yt_dlp"]
+    # Dependencies whose deprecation warnings are hidden outside DEBUG
+    DEPRECATION_WARNING_MODULES: List[str] = ["pytube", "youtube_transcript_api", "yt_dlp"]
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
@@ -23,4 +30,50 @@ class YouTubeConfig:
     """YouTube-related configuration constants."""
     
     DEFAULT_TRANSCRIPT_LANGUAGE = "en"
-    VIDEO_ID_PATTERN = r'(?:v=|be/|embed/)([a-zA-Z0-9_-]{11})'
+    # The lookahead rejects longer ID-like tokens instead of truncating them
+    VIDEO_ID_PATTERN = r'(?:v=|be/|embed/)([a-zA-Z0-9_-]{11})(?![a-zA-Z0-9_-])'
+    # Hyperscan has no lookaround; the boundary is checked after each match
+    VIDEO_ID_SCAN_PATTERN = r'(?:v=|be/|embed/)[a-zA-Z0-9_-]{11}'
+    VIDEO_ID_CHARS = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
+    VIDEO_ID_REGEX = re.compile(VIDEO_ID_PATTERN)
+    YTDL_POOL_SIZE = 8
+    PLAYLIST_METADATA_CONCURRENCY = 8
+    RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_BACKOFF_SECONDS = 1.0
+    # Roughly one page of pytube search results, the previous default
+    SEARCH_DEFAULT_RESULTS = 20
+    # pytube crawls one page per video, so it only starts once yt-dlp is slow,
+    # fails or finds nothing, and stops after a bounded number of videos
+    PLAYLIST_FALLBACK_DELAY_SECONDS = 5.0
+    PLAYLIST_FALLBACK_MAX_VIDEOS = 200
+
+
+class ProcessingConfig:
+    """Tool execution configuration constants."""
+    
+    MAX_TOOL_WORKERS = 8
+    MAX_CONCURRENT_QUERIES = 8
+
+
+class HTTPConfig:
+    """HTTP client configuration constants."""
+    
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 32
+    THUMBNAIL_CHECK_TIMEOUT_SECONDS = 5.0
+
+
+class CacheConfig:
+    """Caching configuration constants."""
+    
+    TOOL_RESULT_MAXSIZE = 1024
+    TOOL_RESULT_TTL_SECONDS = 600
+    YTDLP_INFO_TTL_SECONDS = 86400
+    YTDLP_INFO_TAG = "ytdlp_info"
+    YTDLP_INFO_MEMO_MAXSIZE = 256
+    YTDLP_INFO_MEMO_TTL_SECONDS = 600
+    VIDEO_ID_CACHE_MAXSIZE = 1024
+    TRANSCRIPT_MAXSIZE = 1024
+    TRANSCRIPT_TTL_SECONDS = 3600
+    # Missing captions rarely appear within minutes, but retries should not wait long
+    TRANSCRIPT_NEGATIVE_TTL_SECONDS = 300
@@ -1,12 +1,14 @@
 """Pydantic models for data validation."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VideoMetadata(BaseModel):
     """YouTube video metadata."""
     
+    model_config = ConfigDict(frozen=True)
+    
     title: Optional[str] = None
     views: Optional[int] = None
     duration: Optional[int] = Field(None, description="Duration in seconds")
@@ -19,6 +21,8 @@ class VideoMetadata(BaseModel):
 class Thumbnail(BaseModel):
     """YouTube video thumbnail information."""
     
+    model_config = ConfigDict(frozen=True)
+    
     url: str
     width: Optional[int] = None
     height: Optional[int] = None
@@ -28,7 +32,10 @@ class Thumbnail(BaseModel):
 class VideoSearchResult(BaseModel):
     """YouTube video search result."""
     
-    title: str
+    model_config = ConfigDict(frozen=True)
+    
+    # Flat search entries occasionally come back without a title
+    title: Optional[str]
     video_id: str
     url: str
 
@@ -36,4 +43,33 @@ class VideoSearchResult(BaseModel):
 class QueryRequest(BaseModel):
     """Request model for chain queries."""
     
+    model_config = ConfigDict(frozen=True)
+    
     query: str = Field(..., description="User query to process")
+
+
+class BatchQueryRequest(BaseModel):
+    """Request model for processing several chain queries at once."""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    queries: List[str] = Field(..., description="User queries to process")
+
+
+class ToolInvocation(BaseModel):
+    """A single tool invocation inside a batch request."""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    tool_name: str = Field(..., description="Name of the registered tool to call")
+    arguments: Dict[str, Any] = Field(default_factory=dict, description="Arguments for the tool")
+
+
+class BatchToolInput(BaseModel):
+    """Input schema for the batch tool."""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    invocations: List[ToolInvocation] = Field(
+        ..., description="Independent tool invocations to execute concurrently"
+    )
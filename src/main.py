@@ -2,7 +2,7 @@
 
 import argparse
 import sys
-from pprint import pprint
+from pprint import pformat
 
 from src.core.chain import create_chain, invoke_chain
 from src.utils.logging import setup_logging, get_logger
@@ -50,12 +50,11 @@ def main() -> int:
         # Invoke chain with query
         result = invoke_chain(chain, args.query)
         
-        # Print result
-        print("\n" + "="*80)
-        print("RESULT:")
-        print("="*80)
-        pprint(result)
-        print("="*80 + "\n")
+        # Print result with a single buffered write; pretty-print only when debugging
+        body = pformat(result) if log_level.upper() == "DEBUG" else str(result)
+        separator = "=" * 80
+        sys.stdout.write(f"\n{separator}\nRESULT:\n{separator}\n{body}\n{separator}\n\n")
+        sys.stdout.flush()
         
         logger.info("Application completed successfully")
         return 0
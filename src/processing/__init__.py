@@ -2,14 +2,22 @@
 
 from src.processing.executor import (
     execute_tool,
+    execute_tool_async,
+    execute_tool_calls,
     process_tool_calls,
+    process_tool_calls_async,
     should_continue,
+    astream_recursive_chain,
     create_recursive_chain
 )
 
 __all__ = [
     "execute_tool",
+    "execute_tool_async",
+    "execute_tool_calls",
     "process_tool_calls",
+    "process_tool_calls_async",
     "should_continue",
+    "astream_recursive_chain",
     "create_recursive_chain",
 ]
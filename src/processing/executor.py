@@ -1,19 +1,123 @@
 """Tool execution and processing logic."""
 
-from typing import List, Dict, Any
-import json
-import logging
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 
 from langchain_core.messages import ToolMessage, AIMessage
 from langchain_core.runnables import RunnableLambda
 from langchain_core.language_models import BaseChatModel
 
+from src.core.constants import ProcessingConfig
+from src.processing.limits import get_rate_limiter, get_tool_semaphore
+from src.tools.cache import cache_result, get_cached_result, make_cache_key
 from src.tools.registry import get_tool
-from src.utils.exceptions import ToolExecutionError
 from src.utils.logging import get_logger
+from src.utils.serialization import dumps_json
 
 logger = get_logger(__name__)
 
+# Shared pool for dispatching independent tool calls; tools are network-bound,
+# so threads overlap their I/O instead of stacking latencies.
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=ProcessingConfig.MAX_TOOL_WORKERS,
+    thread_name_prefix="tool-call"
+)
+
+
+# Serializers keyed by the exact result type, so the common str, dict and list
+# results are dispatched with a single lookup
+_COERCE = {
+    str: str,
+    dict: dumps_json,
+    list: dumps_json,
+    bytes: lambda data: data.decode("utf-8", errors="replace"),
+}
+
+
+def _serialize_result(result: Any) -> str:
+    """Serialize a tool result into ToolMessage content."""
+    coerce = _COERCE.get(type(result))
+    if coerce is not None:
+        return coerce(result)
+    # Subclasses such as OrderedDict still serialize as JSON
+    if isinstance(result, (dict, list)):
+        return dumps_json(result)
+    return str(result)
+
+
+def _pending_tool_calls(message: Any) -> List[Dict[str, Any]]:
+    """Return a message's tool calls, taking the direct attribute for AIMessages."""
+    # AIMessage always defines tool_calls; other messages are duck-typed
+    if isinstance(message, AIMessage):
+        return message.tool_calls
+    return getattr(message, 'tool_calls', None) or []
+
+
+def _error_tool_message(tool_call: Dict[str, Any], error_msg: str) -> ToolMessage:
+    """Build a ToolMessage reporting a tool call failure."""
+    return ToolMessage(
+        content=dumps_json({"error": error_msg}),
+        tool_call_id=tool_call.get("id", "unknown"),
+        status="error"
+    )
+
+
+def _prepare_tool_call(
+    tool_call: Dict[str, Any]
+) -> Tuple[str, Dict[str, Any], str, Optional[ToolMessage]]:
+    """
+    Unpack a tool call and look it up in the result cache.
+    
+    Returns:
+        Tuple of tool name, arguments, call ID and the cached ToolMessage
+        (None on a cache miss)
+    
+    Raises:
+        KeyError: If the tool call is missing a required field
+    """
+    tool_name = tool_call["name"]
+    tool_args = tool_call.get("args", {})
+    tool_call_id = tool_call["id"]
+    
+    logger.debug(f"Executing tool: {tool_name} with args: {tool_args}")
+    
+    # Serve idempotent tools from the result cache when possible
+    cached = get_cached_result(tool_name, tool_args)
+    if cached is not None:
+        logger.debug(f"Tool {tool_name} served from cache")
+        return tool_name, tool_args, tool_call_id, ToolMessage(content=cached, tool_call_id=tool_call_id)
+    return tool_name, tool_args, tool_call_id, None
+
+
+def _result_tool_message(
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    tool_call_id: str,
+    result: Any
+) -> ToolMessage:
+    """Serialize and cache a tool result, then wrap it in a ToolMessage."""
+    content = _serialize_result(result)
+    cache_result(tool_name, tool_args, content)
+    
+    logger.debug(f"Tool {tool_name} executed successfully")
+    
+    return ToolMessage(
+        content=content,
+        tool_call_id=tool_call_id
+    )
+
+
+def _failed_tool_message(tool_call: Dict[str, Any], error: Exception) -> ToolMessage:
+    """Log a tool call failure and report it in a ToolMessage."""
+    if isinstance(error, KeyError):
+        error_msg = f"Tool call missing required field: {str(error)}"
+        logger.error(error_msg)
+    else:
+        error_msg = f"Error executing tool {tool_call.get('name', 'unknown')}: {str(error)}"
+        logger.error(error_msg, exc_info=error)
+    return _error_tool_message(tool_call, error_msg)
+
 
 def execute_tool(tool_call: Dict[str, Any]) -> ToolMessage:
     """
@@ -25,51 +129,129 @@ def execute_tool(tool_call: Dict[str, Any]) -> ToolMessage:
                    - args: Tool arguments
                    - id: Tool call ID
                    
+    Returns:
+        ToolMessage with execution result; failures are reported as an error
+        ToolMessage rather than raised
+    """
+    try:
+        tool_name, tool_args, tool_call_id, cached = _prepare_tool_call(tool_call)
+        if cached is not None:
+            return cached
+        result = get_tool(tool_name).invoke(tool_args)
+        return _result_tool_message(tool_name, tool_args, tool_call_id, result)
+    except Exception as e:
+        return _failed_tool_message(tool_call, e)
+
+
+async def execute_tool_async(tool_call: Dict[str, Any]) -> ToolMessage:
+    """
+    Execute a single tool call asynchronously and return a ToolMessage.
+    
+    Args:
+        tool_call: Dictionary containing tool call information (see execute_tool)
+    
     Returns:
         ToolMessage with execution result
-        
-    Raises:
-        ToolExecutionError: If tool execution fails
     """
     try:
-        tool_name = tool_call["name"]
-        tool_args = tool_call.get("args", {})
-        tool_call_id = tool_call["id"]
-        
-        logger.debug(f"Executing tool: {tool_name} with args: {tool_args}")
-        
-        # Get tool from registry
-        tool = get_tool(tool_name)
-        
-        # Execute tool
-        result = tool.invoke(tool_args)
-        
-        # Serialize result
-        if isinstance(result, (dict, list)):
-            content = json.dumps(result, default=str)
-        else:
-            content = str(result)
-        
-        logger.debug(f"Tool {tool_name} executed successfully")
-        
-        return ToolMessage(
-            content=content,
-            tool_call_id=tool_call_id
-        )
-    except KeyError as e:
-        error_msg = f"Tool call missing required field: {str(e)}"
-        logger.error(error_msg)
-        return ToolMessage(
-            content=json.dumps({"error": error_msg}),
-            tool_call_id=tool_call.get("id", "unknown")
-        )
+        tool_name, tool_args, tool_call_id, cached = _prepare_tool_call(tool_call)
+        if cached is not None:
+            return cached
+        result = await get_tool(tool_name).ainvoke(tool_args)
+        return _result_tool_message(tool_name, tool_args, tool_call_id, result)
     except Exception as e:
-        error_msg = f"Error executing tool {tool_call.get('name', 'unknown')}: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        return ToolMessage(
-            content=json.dumps({"error": error_msg}),
-            tool_call_id=tool_call.get("id", "unknown")
+        return _failed_tool_message(tool_call, e)
+
+
+def _execute_tool_limited(tool_call: Dict[str, Any]) -> ToolMessage:
+    """Execute a tool call once the rate limiter admits it."""
+    get_rate_limiter().acquire_sync()
+    return execute_tool(tool_call)
+
+
+async def _execute_tool_async_limited(tool_call: Dict[str, Any]) -> ToolMessage:
+    """Execute a tool call asynchronously within the concurrency and rate limits."""
+    async with get_tool_semaphore():
+        await get_rate_limiter().acquire()
+        return await execute_tool_async(tool_call)
+
+
+def _dedupe_tool_calls(
+    tool_calls: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Fold tool calls with identical name and arguments into one execution.
+    
+    Returns:
+        The unique tool calls, and for each original call the index of the
+        unique call that serves it
+    """
+    unique: List[Dict[str, Any]] = []
+    positions: Dict[Tuple[str, str], int] = {}
+    mapping: List[int] = []
+    for tc in tool_calls:
+        key = make_cache_key(tc.get("name", ""), tc.get("args", {}))
+        if key not in positions:
+            positions[key] = len(unique)
+            unique.append(tc)
+        mapping.append(positions[key])
+    return unique, mapping
+
+
+def _fan_out(
+    tool_calls: List[Dict[str, Any]],
+    unique_messages: List[ToolMessage],
+    mapping: List[int]
+) -> List[ToolMessage]:
+    """Build one ToolMessage per original tool call from the unique results."""
+    if len(unique_messages) == len(tool_calls):
+        return unique_messages
+    return [
+        ToolMessage(
+            content=unique_messages[idx].content,
+            tool_call_id=tc.get("id", "unknown"),
+            status=unique_messages[idx].status
         )
+        for tc, idx in zip(tool_calls, mapping)
+    ]
+
+
+def execute_tool_calls(
+    tool_calls: List[Dict[str, Any]],
+    executor: Optional[ThreadPoolExecutor] = None
+) -> List[ToolMessage]:
+    """
+    Execute tool calls in parallel within the rate limit, in call order.
+    
+    Identical calls run once and cacheable results are served from the cache.
+    
+    Args:
+        tool_calls: Tool calls to execute (see execute_tool)
+        executor: Pool to run the calls on; defaults to the shared tool pool.
+            Callers already running on that pool pass their own, so they never
+            wait on work queued behind themselves.
+    
+    Returns:
+        One ToolMessage per tool call, in the same order
+    """
+    unique, mapping = _dedupe_tool_calls(tool_calls)
+    
+    # Nothing to overlap with a single call, so skip the pool handoff
+    if len(unique) == 1:
+        return _fan_out(tool_calls, [_execute_tool_limited(unique[0])], mapping)
+    
+    # Keep the original order so responses line up with the tool_call_ids
+    # the LLM emitted
+    pool = executor or _TOOL_EXECUTOR
+    futures = {
+        pool.submit(_execute_tool_limited, tc): idx
+        for idx, tc in enumerate(unique)
+    }
+    unique_messages: List[Any] = [None] * len(unique)
+    for future in as_completed(futures):
+        unique_messages[futures[future]] = future.result()
+    
+    return _fan_out(tool_calls, unique_messages, mapping)
 
 
 def process_tool_calls(
@@ -84,12 +266,13 @@ def process_tool_calls(
         llm_with_tools: LLM instance with tools bound
         
     Returns:
-        Updated message history with tool responses and next AI response
+        The same message list, extended in place with the tool responses and
+        the next AI response
     """
     last_message = messages[-1]
     
     # Get tool calls from the last message
-    tool_calls = getattr(last_message, 'tool_calls', [])
+    tool_calls = _pending_tool_calls(last_message)
     
     if not tool_calls:
         logger.warning("process_tool_calls called but no tool calls found")
@@ -97,17 +280,58 @@ def process_tool_calls(
     
     logger.info(f"Processing {len(tool_calls)} tool call(s)")
     
-    # Execute all tool calls in parallel
-    tool_messages = [execute_tool(tc) for tc in tool_calls]
-    
-    # Add tool responses to message history
-    updated_messages = messages + tool_messages
+    # Execute all tool calls in parallel and add the responses to the history
+    messages.extend(execute_tool_calls(tool_calls))
     
     # Get next LLM response
     logger.debug("Invoking LLM with tool responses")
-    next_ai_response = llm_with_tools.invoke(updated_messages)
+    messages.append(llm_with_tools.invoke(messages))
+    
+    return messages
+
+
+async def _run_tool_calls_async(tool_calls: List[Dict[str, Any]]) -> List[ToolMessage]:
+    """Execute tool calls concurrently, returning responses in call order."""
+    unique, mapping = _dedupe_tool_calls(tool_calls)
+    
+    # gather preserves argument order, so tool_call_ids stay aligned
+    unique_messages = list(await asyncio.gather(
+        *[_execute_tool_async_limited(tc) for tc in unique]
+    ))
+    return _fan_out(tool_calls, unique_messages, mapping)
+
+
+async def process_tool_calls_async(
+    messages: List[Any],
+    llm_with_tools: BaseChatModel
+) -> List[Any]:
+    """
+    Asynchronously process tool calls from the last message and get next LLM response.
+    
+    Args:
+        messages: Current message history
+        llm_with_tools: LLM instance with tools bound
+    
+    Returns:
+        The same message list, extended in place with the tool responses and
+        the next AI response
+    """
+    last_message = messages[-1]
+    
+    tool_calls = _pending_tool_calls(last_message)
+    
+    if not tool_calls:
+        logger.warning("process_tool_calls_async called but no tool calls found")
+        return messages
+    
+    logger.info(f"Processing {len(tool_calls)} tool call(s) asynchronously")
+    
+    messages.extend(await _run_tool_calls_async(tool_calls))
+    
+    logger.debug("Invoking LLM with tool responses")
+    messages.append(await llm_with_tools.ainvoke(messages))
     
-    return updated_messages + [next_ai_response]
+    return messages
 
 
 def should_continue(messages: List[Any]) -> bool:
@@ -120,12 +344,7 @@ def should_continue(messages: List[Any]) -> bool:
     Returns:
         True if another iteration is needed, False otherwise
     """
-    if not messages:
-        return False
-    
-    last_message = messages[-1]
-    tool_calls = getattr(last_message, 'tool_calls', None)
-    return bool(tool_calls)
+    return bool(messages) and bool(_pending_tool_calls(messages[-1]))
 
 
 def _recursive_chain(
@@ -133,24 +352,86 @@ def _recursive_chain(
     llm_with_tools: BaseChatModel
 ) -> List[Any]:
     """
-    Recursively process tool calls until completion.
+    Process tool calls until completion.
+    
+    Iterates rather than recursing, so long tool-calling traces neither grow
+    the call stack nor copy the message history on every turn.
     
     Args:
-        messages: Current message history
+        messages: Current message history (extended in place)
         llm_with_tools: LLM instance with tools bound
         
     Returns:
         Final message history after all tool calls are processed
     """
-    if should_continue(messages):
+    while should_continue(messages):
+        logger.debug("Continuing recursive chain - more tool calls detected")
+        messages = process_tool_calls(messages, llm_with_tools)
+    
+    logger.debug("Recursive chain complete - no more tool calls")
+    return messages
+
+
+async def _recursive_chain_async(
+    messages: List[Any],
+    llm_with_tools: BaseChatModel
+) -> List[Any]:
+    """
+    Asynchronously process tool calls until completion.
+    
+    Args:
+        messages: Current message history (extended in place)
+        llm_with_tools: LLM instance with tools bound
+    
+    Returns:
+        Final message history after all tool calls are processed
+    """
+    while should_continue(messages):
         logger.debug("Continuing recursive chain - more tool calls detected")
-        new_messages = process_tool_calls(messages, llm_with_tools)
-        return _recursive_chain(new_messages, llm_with_tools)
+        messages = await process_tool_calls_async(messages, llm_with_tools)
     
     logger.debug("Recursive chain complete - no more tool calls")
     return messages
 
 
+async def astream_recursive_chain(
+    messages: List[Any],
+    llm_with_tools: BaseChatModel
+) -> AsyncIterator[str]:
+    """
+    Stream LLM responses, executing tool calls until completion.
+    
+    Each LLM turn is streamed with astream, so response text is yielded as
+    soon as the first token arrives instead of after the final message.
+    
+    Args:
+        messages: Message history ending before the next LLM turn (extended in place)
+        llm_with_tools: LLM instance with tools bound
+    
+    Yields:
+        Response text chunks as they are produced
+    """
+    while True:
+        response = None
+        async for chunk in llm_with_tools.astream(messages):
+            response = chunk if response is None else response + chunk
+            text = chunk.text
+            if text:
+                yield text
+        
+        if response is None:
+            logger.warning("LLM stream produced no chunks")
+            return
+        
+        messages.append(response)
+        if not should_continue(messages):
+            logger.debug("Streaming chain complete - no more tool calls")
+            return
+        
+        logger.info(f"Processing {len(response.tool_calls)} tool call(s) while streaming")
+        messages.extend(await _run_tool_calls_async(response.tool_calls))
+
+
 def create_recursive_chain(llm_with_tools: BaseChatModel) -> RunnableLambda:
     """
     Create a recursive chain that processes tool calls until completion.
@@ -159,6 +440,13 @@ def create_recursive_chain(llm_with_tools: BaseChatModel) -> RunnableLambda:
         llm_with_tools: LLM instance with tools bound
         
     Returns:
-        RunnableLambda that processes messages recursively
+        RunnableLambda that processes messages recursively, with a native
+        async implementation used by ainvoke
     """
-    return RunnableLambda(lambda messages: _recursive_chain(messages, llm_with_tools))
+    async def _arun(messages: List[Any]) -> List[Any]:
+        return await _recursive_chain_async(messages, llm_with_tools)
+
+    return RunnableLambda(
+        lambda messages: _recursive_chain(messages, llm_with_tools),
+        afunc=_arun
+    )
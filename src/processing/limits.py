@@ -0,0 +1,95 @@
+"""Concurrency and rate limits for tool execution."""
+
+from functools import lru_cache
+import asyncio
+import threading
+import time
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+from src.config.settings import get_settings
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by the sync and async execution paths.
+    
+    Tokens refill continuously at the configured rate up to ``capacity``; each
+    acquire consumes one token, waiting for a refill when the bucket is empty.
+    A non-positive rate disables limiting.
+    """
+    
+    def __init__(self, rate_per_minute: float, capacity: Optional[int] = None):
+        """
+        Initialize the bucket.
+        
+        Args:
+            rate_per_minute: Sustained number of acquisitions allowed per minute
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or max(1, int(self.rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        # A thread lock, since the sync path acquires from worker threads
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """
+        Take a token if one is available.
+        
+        Returns:
+            0.0 if a token was taken, otherwise the seconds to wait before retrying
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+    
+    async def acquire(self) -> None:
+        """Wait asynchronously until a token is available."""
+        wait = self._reserve()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._reserve()
+    
+    def acquire_sync(self) -> None:
+        """Block the calling thread until a token is available."""
+        wait = self._reserve()
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._reserve()
+
+
+# An asyncio.Semaphore binds to the first loop that waits on it, so each event
+# loop gets its own; entries go away with their loop
+_TOOL_SEMAPHORES: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+_semaphores_lock = threading.Lock()
+
+
+def get_tool_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore capping concurrent async tool invocations.
+    
+    Must be called from a running event loop; the semaphore is shared by all
+    tool calls on that loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _semaphores_lock:
+        semaphore = _TOOL_SEMAPHORES.get(loop)
+        if semaphore is None:
+            semaphore = _TOOL_SEMAPHORES[loop] = asyncio.Semaphore(get_settings().max_tool_concurrency)
+        return semaphore
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> TokenBucket:
+    """Get the token bucket limiting tool invocations per minute."""
+    settings = get_settings()
+    return TokenBucket(settings.tool_rpm, capacity=settings.max_tool_concurrency)
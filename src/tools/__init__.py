@@ -8,16 +8,22 @@ from src.tools.registry import (
 )
 from src.tools.youtube import (
     extract_video_id,
+    extract_video_ids,
     fetch_transcript,
+    fetch_transcripts_bulk,
     search_youtube,
     get_full_metadata,
+    get_full_metadata_bulk,
     get_thumbnails,
+    get_thumbnails_bulk,
     get_channel_info,
     get_playlist_info,
     get_playlist_videos,
+    get_playlist_metadata,
     fetch_transcript_with_timestamps,
     list_transcript_languages
 )
+from src.tools.batch import batch_tool
 
 __all__ = [
     "get_all_tools",
@@ -25,13 +31,19 @@ __all__ = [
     "register_tool",
     "TOOL_REGISTRY",
     "extract_video_id",
+    "extract_video_ids",
     "fetch_transcript",
+    "fetch_transcripts_bulk",
     "search_youtube",
     "get_full_metadata",
+    "get_full_metadata_bulk",
     "get_thumbnails",
+    "get_thumbnails_bulk",
     "get_channel_info",
     "get_playlist_info",
     "get_playlist_videos",
+    "get_playlist_metadata",
     "fetch_transcript_with_timestamps",
     "list_transcript_languages",
+    "batch_tool",
 ]
@@ -0,0 +1,91 @@
+"""Batch meta-tool for executing several tool invocations concurrently."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any
+
+from langchain.tools import tool
+from langchain_core.messages import ToolMessage
+
+from src.core.constants import ProcessingConfig
+from src.core.models import BatchToolInput, ToolInvocation
+from src.utils.logging import get_logger
+from src.utils.serialization import dumps_json, loads_json
+
+logger = get_logger(__name__)
+
+BATCH_TOOL_NAME = "batch_tool"
+
+
+def _batch_entry(tool_name: str, message: ToolMessage) -> Dict[str, Any]:
+    """
+    Convert the ToolMessage of one invocation into its batch result entry.
+    
+    Args:
+        tool_name: Name of the invoked tool
+        message: ToolMessage produced by the executor
+    
+    Returns:
+        Dictionary with the tool name and either its result or an error message.
+    """
+    if message.status == "error":
+        return {"tool_name": tool_name, "error": loads_json(message.content)["error"]}
+    # Dict and list results arrive JSON-encoded and are nested back as objects;
+    # plain-text results are kept as they are
+    try:
+        result = loads_json(message.content)
+    except ValueError:
+        result = message.content
+    return {"tool_name": tool_name, "result": result}
+
+
+@tool(BATCH_TOOL_NAME, args_schema=BatchToolInput)
+def batch_tool(invocations: List[ToolInvocation]) -> str:
+    """
+    Execute several independent tool invocations concurrently in a single call.
+    
+    Use this whenever a request needs multiple lookups that do not depend on
+    each other (e.g. metadata and thumbnails for several videos).
+    
+    Args:
+        invocations: List of invocations, each with a tool_name and arguments.
+    
+    Returns:
+        JSON-encoded list of results in the same order as the invocations. Each
+        entry contains the tool_name and either a result or an error.
+    """
+    # Imported here because the executor imports the registry, which imports
+    # this module to register batch_tool
+    from src.processing.executor import execute_tool_calls
+    
+    invocations = [
+        inv if isinstance(inv, ToolInvocation) else ToolInvocation.model_validate(inv)
+        for inv in invocations
+    ]
+    if not invocations:
+        return dumps_json([])
+    
+    logger.info(f"Executing batch of {len(invocations)} tool invocation(s)")
+    
+    results: List[Any] = [None] * len(invocations)
+    tool_calls: List[Dict[str, Any]] = []
+    positions: List[int] = []
+    for idx, invocation in enumerate(invocations):
+        if invocation.tool_name == BATCH_TOOL_NAME:
+            error_msg = f"Error executing tool {BATCH_TOOL_NAME}: batch_tool cannot be nested inside a batch"
+            logger.error(error_msg)
+            results[idx] = {"tool_name": invocation.tool_name, "error": error_msg}
+            continue
+        tool_calls.append({"name": invocation.tool_name, "args": invocation.arguments, "id": f"batch-{idx}"})
+        positions.append(idx)
+    
+    if tool_calls:
+        # Each invocation goes through the executor like a top-level call, so it
+        # is deduplicated, cached and rate limited; a dedicated pool keeps this
+        # call from waiting on the shared tool pool it may itself be running on
+        max_workers = min(len(tool_calls), ProcessingConfig.MAX_TOOL_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-tool") as pool:
+            messages = execute_tool_calls(tool_calls, executor=pool)
+        for idx, message in zip(positions, messages):
+            results[idx] = _batch_entry(invocations[idx].tool_name, message)
+    
+    return dumps_json(results)
@@ -0,0 +1,294 @@
+"""Result caching for idempotent tools and fetched transcripts."""
+
+import os
+import threading
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import diskcache
+from cachetools import TTLCache
+
+from src.config.settings import get_settings
+from src.core.constants import CacheConfig
+from src.utils.logging import get_logger
+from src.utils.serialization import dumps_json, loads_json
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+logger = get_logger(__name__)
+
+# Tools whose output depends only on their arguments for at least the cache TTL.
+# Search results and playlist listings change too often to be cached.
+CACHEABLE_TOOLS = frozenset({
+    "extract_video_id",
+    "extract_video_ids",
+    "fetch_transcript",
+    "fetch_transcripts_bulk",
+    "fetch_transcript_with_timestamps",
+    "list_transcript_languages",
+    "get_full_metadata",
+    "get_full_metadata_bulk",
+    "get_thumbnails",
+    "get_thumbnails_bulk",
+    "get_channel_info",
+})
+
+TOOL_RESULT_CACHE: TTLCache = TTLCache(
+    maxsize=CacheConfig.TOOL_RESULT_MAXSIZE,
+    ttl=CacheConfig.TOOL_RESULT_TTL_SECONDS
+)
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_tool_disk_cache() -> Optional[diskcache.Cache]:
+    """Open the tool result disk cache, or return None unless it is enabled."""
+    settings = get_settings()
+    if settings.yt_cache_disable or not settings.yt_tool_disk_cache:
+        return None
+    return diskcache.Cache(os.path.join(os.path.expanduser(settings.yt_cache_dir), "tool_results"))
+
+
+def make_cache_key(tool_name: str, tool_args: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build a cache key from a tool name and its arguments.
+    
+    Args:
+        tool_name: Tool name
+        tool_args: Tool arguments
+    
+    Returns:
+        Hashable key that is independent of argument order
+    """
+    return tool_name, dumps_json(tool_args, sort_keys=True)
+
+
+def _result_cache_key(tool_name: str, tool_args: Dict[str, Any]) -> Tuple[str, str]:
+    """Build the result cache key, leaving force_refresh out so a refresh replaces the usual entry."""
+    if "force_refresh" in tool_args:
+        tool_args = {name: value for name, value in tool_args.items() if name != "force_refresh"}
+    return make_cache_key(tool_name, tool_args)
+
+
+def get_cached_result(tool_name: str, tool_args: Dict[str, Any]) -> Optional[str]:
+    """
+    Look up a cached tool result.
+    
+    Args:
+        tool_name: Tool name
+        tool_args: Tool arguments
+    
+    Returns:
+        Cached serialized result, or None on a miss or for non-cacheable tools
+    """
+    # A refresh request must reach the tool, which refreshes its own caches
+    if tool_name not in CACHEABLE_TOOLS or tool_args.get("force_refresh"):
+        return None
+    key = _result_cache_key(tool_name, tool_args)
+    with _cache_lock:
+        content = TOOL_RESULT_CACHE.get(key)
+    if content is not None:
+        return content
+    
+    disk = _get_tool_disk_cache()
+    if disk is None:
+        return None
+    try:
+        content = disk.get(key)
+    except Exception as e:
+        logger.warning(f"Tool result disk cache read failed for {tool_name}: {e}")
+        return None
+    if content is not None:
+        with _cache_lock:
+            TOOL_RESULT_CACHE[key] = content
+    return content
+
+
+def cache_result(tool_name: str, tool_args: Dict[str, Any], content: str) -> None:
+    """
+    Store a serialized tool result if the tool is cacheable.
+    
+    Args:
+        tool_name: Tool name
+        tool_args: Tool arguments
+        content: Serialized tool result
+    """
+    if tool_name not in CACHEABLE_TOOLS:
+        return
+    key = _result_cache_key(tool_name, tool_args)
+    with _cache_lock:
+        TOOL_RESULT_CACHE[key] = content
+
+    disk = _get_tool_disk_cache()
+    if disk is not None:
+        try:
+            disk.set(key, content, expire=CacheConfig.TOOL_RESULT_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Tool result disk cache write failed for {tool_name}: {e}")
+
+
+def clear_tool_cache() -> None:
+    """Remove all in-process cached tool results."""
+    with _cache_lock:
+        TOOL_RESULT_CACHE.clear()
+
+
+# Transcripts are immutable per (video, language) and shared across users, so
+# they are kept longer than tool results, in Redis when one is configured
+_LOCAL_TRANSCRIPTS: TTLCache = TTLCache(
+    maxsize=CacheConfig.TRANSCRIPT_MAXSIZE,
+    ttl=CacheConfig.TRANSCRIPT_TTL_SECONDS
+)
+# Videos known to have no transcript, so agent retries skip the fetch
+_LOCAL_MISSING_TRANSCRIPTS: TTLCache = TTLCache(
+    maxsize=CacheConfig.TRANSCRIPT_MAXSIZE,
+    ttl=CacheConfig.TRANSCRIPT_NEGATIVE_TTL_SECONDS
+)
+_transcript_lock = threading.Lock()
+# Hit and miss counts for monitoring, whichever backend serves the lookups
+_transcript_stats: Counter = Counter()
+
+
+@lru_cache(maxsize=1)
+def _get_redis_client() -> Optional[Any]:
+    """Create the Redis client from REDIS_URL, or return None if unavailable."""
+    redis_url = get_settings().redis_url
+    if not redis_url:
+        return None
+    if redis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed")
+        return None
+    return redis.Redis.from_url(redis_url)
+
+
+def transcript_cache_key(kind: str, video_id: str, language: str) -> str:
+    """
+    Build the cache key for a transcript.
+    
+    Args:
+        kind: "tx" for plain text, "txt" for timestamped segments, "txneg"
+            for recorded missing transcripts (a separate namespace, so purging
+            transcripts leaves them alone)
+        video_id: YouTube video ID
+        language: Transcript language code
+    
+    Returns:
+        Cache key
+    """
+    return f"yt:{kind}:{video_id}:{language}"
+
+
+def get_cached_transcript(key: str) -> Optional[Any]:
+    """
+    Look up a cached transcript.
+    
+    Args:
+        key: Key from transcript_cache_key
+    
+    Returns:
+        Cached transcript, or None on a miss
+    """
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            payload = client.get(key)
+            value = loads_json(zlib.decompress(payload)) if payload is not None else None
+        except Exception as e:
+            logger.warning(f"Redis transcript cache read failed for {key}: {e}")
+            value = None
+    else:
+        with _transcript_lock:
+            value = _LOCAL_TRANSCRIPTS.get(key)
+    
+    outcome = 'cache_hit' if value is not None else 'cache_miss'
+    with _transcript_lock:
+        _transcript_stats[outcome] += 1
+    logger.info(f"{outcome}: {key}")
+    return value
+
+
+def cache_transcript(key: str, value: Any) -> None:
+    """
+    Store a transcript in the cache.
+    
+    Args:
+        key: Key from transcript_cache_key
+        value: Transcript text or list of timestamped segments
+    """
+    client = _get_redis_client()
+    if client is None:
+        with _transcript_lock:
+            _LOCAL_TRANSCRIPTS[key] = value
+        return
+    try:
+        client.setex(key, CacheConfig.TRANSCRIPT_TTL_SECONDS, zlib.compress(dumps_json(value).encode()))
+    except Exception as e:
+        logger.warning(f"Redis transcript cache write failed for {key}: {e}")
+
+
+def get_missing_transcript(key: str) -> Optional[str]:
+    """
+    Look up a recorded missing-transcript error.
+    
+    Args:
+        key: Key from transcript_cache_key with kind "txneg"
+    
+    Returns:
+        Error message from the failed fetch, or None if none is recorded
+    """
+    client = _get_redis_client()
+    if client is None:
+        with _transcript_lock:
+            return _LOCAL_MISSING_TRANSCRIPTS.get(key)
+    try:
+        payload = client.get(key)
+        return payload.decode() if payload is not None else None
+    except Exception as e:
+        logger.warning(f"Redis transcript cache read failed for {key}: {e}")
+        return None
+
+
+def cache_missing_transcript(key: str, message: str) -> None:
+    """
+    Record that a transcript is unavailable, for a short TTL.
+    
+    Args:
+        key: Key from transcript_cache_key with kind "txneg"
+        message: Error message to report on later lookups
+    """
+    client = _get_redis_client()
+    if client is None:
+        with _transcript_lock:
+            _LOCAL_MISSING_TRANSCRIPTS[key] = message
+        return
+    try:
+        client.setex(key, CacheConfig.TRANSCRIPT_NEGATIVE_TTL_SECONDS, message.encode())
+    except Exception as e:
+        logger.warning(f"Redis transcript cache write failed for {key}: {e}")
+
+
+def get_transcript_cache_stats() -> Dict[str, int]:
+    """
+    Get the transcript cache hit and miss counts.
+    
+    Returns:
+        Dictionary with hits and misses since start-up or the last clear
+    """
+    with _transcript_lock:
+        return {
+            "hits": _transcript_stats['cache_hit'],
+            "misses": _transcript_stats['cache_miss'],
+        }
+
+
+def clear_transcript_cache() -> None:
+    """Remove all transcripts from the in-process cache and reset its counters."""
+    with _transcript_lock:
+        _LOCAL_TRANSCRIPTS.clear()
+        _LOCAL_MISSING_TRANSCRIPTS.clear()
+        _transcript_stats.clear()
@@ -0,0 +1,33 @@
+"""Shared HTTP session for tools that accept an injected client."""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.core.constants import HTTPConfig
+
+
+def _create_session() -> requests.Session:
+    """
+    Create a requests session with a connection pool sized for parallel tool calls.
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTPConfig.POOL_CONNECTIONS,
+        pool_maxsize=HTTPConfig.POOL_MAXSIZE
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Module-level session so every call reuses pooled keep-alive connections
+# instead of paying a TCP + TLS handshake per request
+SESSION = _create_session()
+
+
+def close_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    SESSION.close()
@@ -1,34 +1,46 @@
 """Tool registry for managing and discovering available tools."""
 
-from typing import Dict, List, Any
+from typing import Dict, List
 from langchain.tools import BaseTool
 
 from src.tools.youtube import (
     extract_video_id,
+    extract_video_ids,
     fetch_transcript,
+    fetch_transcripts_bulk,
     search_youtube,
     get_full_metadata,
+    get_full_metadata_bulk,
     get_thumbnails,
+    get_thumbnails_bulk,
     get_channel_info,
     get_playlist_info,
     get_playlist_videos,
+    get_playlist_metadata,
     fetch_transcript_with_timestamps,
     list_transcript_languages
 )
+from src.tools.batch import batch_tool
 
 
 # Registry mapping tool names to tool instances
 TOOL_REGISTRY: Dict[str, BaseTool] = {
     "extract_video_id": extract_video_id,
+    "extract_video_ids": extract_video_ids,
     "fetch_transcript": fetch_transcript,
+    "fetch_transcripts_bulk": fetch_transcripts_bulk,
     "search_youtube": search_youtube,
     "get_full_metadata": get_full_metadata,
+    "get_full_metadata_bulk": get_full_metadata_bulk,
     "get_thumbnails": get_thumbnails,
+    "get_thumbnails_bulk": get_thumbnails_bulk,
     "get_channel_info": get_channel_info,
     "get_playlist_info": get_playlist_info,
     "get_playlist_videos": get_playlist_videos,
+    "get_playlist_metadata": get_playlist_metadata,
     "fetch_transcript_with_timestamps": fetch_transcript_with_timestamps,
     "list_transcript_languages": list_transcript_languages,
+    "batch_tool": batch_tool,
 }
 
 
@@ -55,10 +67,11 @@ def get_tool(name: str) -> BaseTool:
     Raises:
         KeyError: If tool is not found in registry
     """
-    if name not in TOOL_REGISTRY:
+    tool = TOOL_REGISTRY.get(name)
+    if tool is None:
         available = ", ".join(TOOL_REGISTRY.keys())
         raise KeyError(f"Tool '{name}' not found. Available tools: {available}")
-    return TOOL_REGISTRY[name]
+    return tool
 
 
 def register_tool(name: str, tool: BaseTool) -> None:
@@ -1,16 +1,52 @@
 """YouTube-specific tool definitions."""
 
-import re
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+from calendar import isleap
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+import asyncio
+import atexit
 import logging
+import os
+import queue
+import threading
 
-from pytube import Search as youtube_search, Playlist
+import diskcache
+from cachetools import LRUCache, TTLCache
+import requests
+
+from pytube import Playlist
 from langchain.tools import tool
+from langchain_core.tools import StructuredTool
 import yt_dlp
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import (
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    YouTubeTranscriptApi
+)
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
 
-from src.core.constants import YouTubeConfig
+from src.config.settings import get_settings
+from src.core.constants import CacheConfig, HTTPConfig, YouTubeConfig
+from src.core.models import VideoSearchResult
+from src.tools.cache import (
+    cache_missing_transcript,
+    cache_transcript,
+    get_cached_transcript,
+    get_missing_transcript,
+    transcript_cache_key,
+)
+from src.tools.http import SESSION
 from src.utils.exceptions import (
     InvalidVideoURLError,
     TranscriptNotFoundError,
@@ -21,20 +57,219 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Bound once at import so the hot path skips the class attribute lookups
+_VIDEO_ID_RE = YouTubeConfig.VIDEO_ID_REGEX
+_VIDEO_ID_LENGTH = 11
+_VIDEO_ID_CHARS = YouTubeConfig.VIDEO_ID_CHARS
+# Common to youtube.com, youtu.be and youtube-nocookie.com
+_URL_MARKER = "youtu"
+_VIDEO_ID_ALPHABET = bytes(sorted(_VIDEO_ID_CHARS)).decode()
+# Canonical URL prefixes ending in the ID marker; none contains an earlier
+# marker, so an ID right after one is exactly what the regex would find
+_CANONICAL_PREFIXES = (
+    "https://www.youtube.com/watch?v=",
+    "https://youtube.com/watch?v=",
+    "https://m.youtube.com/watch?v=",
+    "https://youtu.be/",
+)
+
+
+def _compile_hyperscan_db() -> Optional[Any]:
+    """Compile the video ID pattern into a Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[YouTubeConfig.VIDEO_ID_SCAN_PATTERN.encode()],
+            ids=[0],
+            flags=[0]
+        )
+        return db
+    except Exception as e:  # pragma: no cover - depends on the native library
+        logger.warning(f"Hyperscan unavailable, using re for video IDs: {e}")
+        return None
+
+
+_HS_DB = _compile_hyperscan_db()
+# A Hyperscan database shares one scratch space, so scans must not overlap
+_HS_LOCK = threading.Lock()
+
+
+def _scan_video_id(text: str) -> Optional[str]:
+    """
+    Scan text for the first video ID with Hyperscan.
+    
+    The pattern has a fixed-length tail, so a match end offset locates an ID
+    without capture groups. Matches followed by another ID character are
+    skipped, which stands in for the lookahead of VIDEO_ID_PATTERN, so the
+    result equals re.search.
+    """
+    data = text.encode()
+    ends: List[int] = []
+    
+    def _on_match(_id: int, _start: int, end: int, _flags: int, _context: Any) -> Optional[bool]:
+        if end < len(data) and data[end] in _VIDEO_ID_CHARS:
+            return None
+        ends.append(end)
+        # Returning True stops the scan
+        return True
+    
+    with _HS_LOCK:
+        _HS_DB.scan(data, match_event_handler=_on_match)
+    return data[ends[0] - _VIDEO_ID_LENGTH:ends[0]].decode() if ends else None
+
+
+@lru_cache(maxsize=CacheConfig.VIDEO_ID_CACHE_MAXSIZE)
+def _find_video_id(url: str) -> Optional[str]:
+    """
+    Return the first video ID in a URL, or None if there is none.
+    
+    Memoized because agents pass the same URL to several tools in a
+    conversation; misses are cached too, as None.
+    """
+    # Substring search rejects non-YouTube input long before a regex could
+    if _URL_MARKER not in url:
+        return None
+    for prefix in _CANONICAL_PREFIXES:
+        if url.startswith(prefix):
+            start = len(prefix)
+            end = start + _VIDEO_ID_LENGTH
+            candidate = url[start:end]
+            # strip() leaves nothing only if every character is an ID character
+            if (len(candidate) == _VIDEO_ID_LENGTH and not candidate.strip(_VIDEO_ID_ALPHABET)
+                    and (end == len(url) or url[end] not in _VIDEO_ID_ALPHABET)):
+                return candidate
+            break
+    if _HS_DB is not None:
+        return _scan_video_id(url)
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
 
-def _get_suppressed_yt_dlp_logger() -> logging.Logger:
-    """Get a yt-dlp logger with warnings suppressed."""
-    yt_dlp_logger = logging.getLogger('yt_dlp')
-    yt_dlp_logger.setLevel(logging.ERROR)
-    return yt_dlp_logger
 
+# yt-dlp logger with warnings suppressed, configured once at import
+_YTDLP_LOGGER = logging.getLogger('yt_dlp')
+_YTDLP_LOGGER.setLevel(logging.ERROR)
 
-def _extract_info_with_ytdlp(url: str) -> Dict[str, Any]:
+
+class _YoutubeDLPool:
+    """
+    Lazily grown pool of reusable YoutubeDL instances.
+    
+    Reusing an instance keeps its HTTP opener, and with it open connections and
+    the TLS session cache, across extractions. YoutubeDL is not thread-safe, so
+    each instance is lent to one thread at a time.
+    """
+    
+    def __init__(self, size: int, options: Optional[Dict[str, Any]] = None):
+        self._size = size
+        self._options = options or {}
+        self._idle: "queue.LifoQueue[yt_dlp.YoutubeDL]" = queue.LifoQueue()
+        self._instances: List[yt_dlp.YoutubeDL] = []
+        self._lock = threading.Lock()
+    
+    def _create(self) -> yt_dlp.YoutubeDL:
+        return yt_dlp.YoutubeDL({
+            'quiet': True,
+            'logger': _YTDLP_LOGGER,
+            **self._options
+        })
+    
+    @contextmanager
+    def borrow(self) -> Iterator[yt_dlp.YoutubeDL]:
+        """Lend an idle instance, creating one while the pool is below its size."""
+        try:
+            ydl = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                grow = len(self._instances) < self._size
+                if grow:
+                    ydl = self._create()
+                    self._instances.append(ydl)
+            if not grow:
+                ydl = self._idle.get()
+        try:
+            yield ydl
+        finally:
+            with self._lock:
+                # Instances closed while lent out are not returned to the pool
+                if any(ydl is owned for owned in self._instances):
+                    self._idle.put(ydl)
+    
+    def close(self) -> None:
+        """Close every instance and empty the pool."""
+        with self._lock:
+            for ydl in self._instances:
+                try:
+                    ydl.close()
+                except Exception as e:  # pragma: no cover - best-effort cleanup
+                    logger.debug(f"Error closing YoutubeDL instance: {e}")
+            self._instances.clear()
+            self._idle = queue.LifoQueue()
+
+
+_YDL_POOL = _YoutubeDLPool(YouTubeConfig.YTDL_POOL_SIZE)
+# Lists playlist entries without resolving each video
+_FLAT_YDL_POOL = _YoutubeDLPool(YouTubeConfig.YTDL_POOL_SIZE, {'extract_flat': 'in_playlist'})
+
+
+def _close_ydl_pools() -> None:
+    """Close every pooled YoutubeDL instance."""
+    _YDL_POOL.close()
+    _FLAT_YDL_POOL.close()
+
+
+atexit.register(_close_ydl_pools)
+
+
+# In-process layer over the disk cache, so tools projecting different fields of
+# the same video skip disk reads and unpickling; entries are treated as read-only.
+# Expiring entries keeps a long-running server from pinning stale counters.
+_INFO_MEMO: TTLCache = TTLCache(
+    maxsize=CacheConfig.YTDLP_INFO_MEMO_MAXSIZE,
+    ttl=CacheConfig.YTDLP_INFO_MEMO_TTL_SECONDS
+)
+_INFO_MEMO_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_info_cache() -> Optional[diskcache.Cache]:
+    """Open the yt-dlp info disk cache, or return None if it is disabled."""
+    settings = get_settings()
+    if settings.yt_cache_disable:
+        return None
+    return diskcache.Cache(os.path.expanduser(settings.yt_cache_dir))
+
+
+def cache_invalidate(url: str) -> bool:
+    """
+    Drop the cached yt-dlp info for a URL.
+    
+    Args:
+        url: URL whose cached info should be removed
+    
+    Returns:
+        True if an entry was removed, False otherwise
+    """
+    keys = (url, f"flat:{url}")
+    with _INFO_MEMO_LOCK:
+        removed = [_INFO_MEMO.pop(key, None) is not None for key in keys]
+    cache = _get_info_cache()
+    if cache is not None:
+        removed += [cache.delete(key) for key in keys]
+    return any(removed)
+
+
+def _extract_info_with_ytdlp(url: str, flat: bool = False) -> Dict[str, Any]:
     """
     Helper function to extract info using yt-dlp.
     
+    Results are memoized in process and on disk per URL, so the tools that
+    project fields from the same info dict share one extraction.
+    
     Args:
         url: YouTube URL (video, playlist, or channel)
+        flat: List playlist entries without extracting each video
         
     Returns:
         Dictionary containing extracted info
@@ -43,20 +278,92 @@ def _extract_info_with_ytdlp(url: str) -> Dict[str, Any]:
         VideoNotFoundError: If content is not found.
         ToolExecutionError: If extraction fails.
     """
-    yt_dlp_logger = _get_suppressed_yt_dlp_logger()
+    cache_key = f"flat:{url}" if flat else url
+    with _INFO_MEMO_LOCK:
+        info = _INFO_MEMO.get(cache_key)
+    if info is not None:
+        return info
+    
+    cache = _get_info_cache()
+    if cache is not None:
+        try:
+            info = cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"yt-dlp info cache read failed for {url}: {e}")
+            info = None
+    
+    if info is None:
+        info = _extract_info_uncached(url, flat)
+        if cache is not None:
+            try:
+                cache.set(
+                    cache_key,
+                    info,
+                    expire=CacheConfig.YTDLP_INFO_TTL_SECONDS,
+                    tag=CacheConfig.YTDLP_INFO_TAG
+                )
+            except Exception as e:
+                logger.warning(f"yt-dlp info cache write failed for {url}: {e}")
+    
+    with _INFO_MEMO_LOCK:
+        _INFO_MEMO[cache_key] = info
+    return info
+
+
+# (timestamp key, date key) pairs that yt-dlp's processing fills in
+_TIMESTAMP_DATES = (('timestamp', 'upload_date'), ('release_timestamp', 'release_date'))
+
+
+def _fill_processed_fields(info: Dict[str, Any]) -> None:
+    """
+    Fill in the fields the tools read that yt-dlp's processing would derive.
+    
+    Dates come from timestamps as UTC YYYYMMDD strings, and is_live and
+    was_live from live_status.
+    """
+    for ts_key, date_key in _TIMESTAMP_DATES:
+        timestamp = info.get(ts_key)
+        if info.get(date_key) is None and timestamp is not None:
+            try:
+                info[date_key] = datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y%m%d')
+            except (TypeError, ValueError, OverflowError, OSError):
+                pass
     
+    live_status = info.get('live_status')
+    if live_status:
+        info.setdefault('is_live', live_status == 'is_live')
+        info.setdefault('was_live', live_status in ('was_live', 'post_live'))
+
+
+def _extract_info_uncached(url: str, flat: bool = False) -> Dict[str, Any]:
+    """Extract info using yt-dlp without consulting the cache."""
+    pool = _FLAT_YDL_POOL if flat else _YDL_POOL
     try:
-        with yt_dlp.YoutubeDL({'quiet': True, 'logger': yt_dlp_logger}) as ydl:
-            info = ydl.extract_info(url, download=False)
-            if not info:
-                raise VideoNotFoundError(f"Content not found: {url}")
-            return info
+        with pool.borrow() as ydl:
+            if flat:
+                info = ydl.extract_info(url, download=False)
+            else:
+                # No tool reads a selected format, so skip format sorting and
+                # selection; playlists, channels and redirects still need resolving
+                info = ydl.extract_info(url, download=False, process=False)
+                if info is not None and info.get('_type', 'video') != 'video':
+                    info = ydl.process_ie_result(info, download=False)
+                elif info is not None:
+                    _fill_processed_fields(info)
+        if info is None:
+            raise VideoNotFoundError(f"Content not found: {url}")
+        return info
     except VideoNotFoundError:
         raise
     except Exception as e:
         error_msg = f"Failed to extract info for {url}: {str(e)}"
         logger.error(error_msg)
-        raise ToolExecutionError(error_msg)
+        # Chained so rate-limit detection can read the underlying HTTP status
+        raise ToolExecutionError(error_msg) from e
+
+
+# Index 0 is unused so months index directly; leap days are checked separately
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 
 def _format_upload_date(date_str: Optional[str]) -> Optional[str]:
@@ -69,13 +376,16 @@ def _format_upload_date(date_str: Optional[str]) -> Optional[str]:
     Returns:
         Formatted date string (YYYY-MM-DD) or None if invalid
     """
-    if not date_str or len(date_str) != 8:
+    # isdigit alone accepts Unicode digits such as '²' that int() rejects
+    if not date_str or len(date_str) != 8 or not (date_str.isascii() and date_str.isdigit()):
         return None
-    try:
-        date_obj = datetime.strptime(date_str, '%Y%m%d')
-        return date_obj.strftime('%Y-%m-%d')
-    except ValueError:
+    year, month, day = int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8])
+    # Year 0 does not exist in datetime, so strptime rejected it as well
+    if year == 0 or not 1 <= month <= 12 or day < 1:
+        return None
+    if day > _DAYS_IN_MONTH[month] and not (month == 2 and day == 29 and isleap(year)):
         return None
+    return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
 
 
 @tool
@@ -93,9 +403,9 @@ def extract_video_id(url: str) -> str:
         InvalidVideoURLError: If the URL format is invalid.
     """
     try:
-        match = re.search(YouTubeConfig.VIDEO_ID_PATTERN, url)
-        if match:
-            return match.group(1)
+        video_id = _find_video_id(url)
+        if video_id:
+            return video_id
         raise InvalidVideoURLError(f"Invalid YouTube URL format: {url}")
     except InvalidVideoURLError:
         raise
@@ -105,13 +415,74 @@ def extract_video_id(url: str) -> str:
 
 
 @tool
-def fetch_transcript(video_id: str, language: str = YouTubeConfig.DEFAULT_TRANSCRIPT_LANGUAGE) -> str:
+def extract_video_ids(urls: List[str]) -> List[Optional[str]]:
+    """
+    Extracts the 11-character YouTube video IDs from several URLs at once.
+    
+    Args:
+        urls: YouTube URLs containing video IDs.
+    
+    Returns:
+        One entry per URL, in input order: the URL's video ID, or None if it
+        has no recognizable video ID.
+    """
+    # Per-URL lookups keep each result aligned with its input and share the
+    # memoized lookups with extract_video_id
+    return [_find_video_id(url) for url in urls]
+
+
+_SNIPPET_TEXT = attrgetter('text')
+
+
+@lru_cache(maxsize=1)
+def _get_transcript_api() -> YouTubeTranscriptApi:
+    """Get the shared transcript API client, bound to the pooled HTTP session."""
+    return YouTubeTranscriptApi(http_client=SESSION)
+
+
+def _fetch_transcript_text(video_id: str, language: str, force_refresh: bool = False) -> str:
+    """Fetch transcript text through the transcript cache."""
+    cache_key = transcript_cache_key("tx", video_id, language)
+    if not force_refresh:
+        cached = get_cached_transcript(cache_key)
+        if cached is not None:
+            return cached
+        missing = get_missing_transcript(transcript_cache_key("txneg", video_id, language))
+        if missing is not None:
+            raise TranscriptNotFoundError(missing)
+    
+    try:
+        transcript = _get_transcript_api().fetch(video_id, languages=[language])
+        text = " ".join(map(_SNIPPET_TEXT, transcript.snippets))
+        cache_transcript(cache_key, text)
+        return text
+    except (NoTranscriptFound, TranscriptsDisabled) as e:
+        error_msg = f"No transcript available for video {video_id}: {str(e)}"
+        logger.error(error_msg)
+        cache_missing_transcript(transcript_cache_key("txneg", video_id, language), error_msg)
+        raise TranscriptNotFoundError(error_msg) from e
+    except VideoUnavailable as e:
+        error_msg = f"Video {video_id} is unavailable: {str(e)}"
+        logger.error(error_msg)
+        raise VideoNotFoundError(error_msg) from e
+    except Exception as e:
+        error_msg = f"Failed to fetch transcript for video {video_id}: {str(e)}"
+        logger.error(error_msg)
+        raise ToolExecutionError(error_msg) from e
+
+
+def _fetch_transcript(
+    video_id: str,
+    language: str = YouTubeConfig.DEFAULT_TRANSCRIPT_LANGUAGE,
+    force_refresh: bool = False
+) -> str:
     """
     Fetches the transcript of a YouTube video.
     
     Args:
         video_id: The YouTube video ID (e.g., "dQw4w9WgXcQ").
         language: Language code for the transcript (e.g., "en", "es").
+        force_refresh: Fetch again even if the transcript is cached.
     
     Returns:
         The transcript text.
@@ -120,54 +491,124 @@ def fetch_transcript(video_id: str, language: str = YouTubeConfig.DEFAULT_TRANSC
         TranscriptNotFoundError: If transcript is not available.
         ToolExecutionError: If transcript fetching fails.
     """
-    try:
-        ytt_api = YouTubeTranscriptApi()
-        transcript = ytt_api.fetch(video_id, languages=[language])
-        return " ".join([snippet.text for snippet in transcript.snippets])
-    except Exception as e:
-        error_msg = f"Failed to fetch transcript for video {video_id}: {str(e)}"
-        logger.error(error_msg)
-        if "No transcripts were found" in str(e) or "TranscriptsDisabled" in str(e):
-            raise TranscriptNotFoundError(error_msg)
-        raise ToolExecutionError(error_msg)
+    return _fetch_transcript_text(video_id, language, force_refresh)
+
+
+async def _afetch_transcript(
+    video_id: str,
+    language: str = YouTubeConfig.DEFAULT_TRANSCRIPT_LANGUAGE,
+    force_refresh: bool = False
+) -> str:
+    """Fetch a transcript on the fan-out executor, keeping the event loop free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _FANOUT_EXECUTOR, _fetch_transcript_text, video_id, language, force_refresh
+    )
+
+
+# Built explicitly so that ainvoke awaits the coroutine instead of handing the
+# blocking function to the event loop's shared default executor
+fetch_transcript = StructuredTool.from_function(
+    func=_fetch_transcript,
+    coroutine=_afetch_transcript,
+    name="fetch_transcript"
+)
 
 
 @tool
-def search_youtube(query: str, max_results: Optional[int] = None) -> List[Dict[str, str]]:
+def search_youtube(query: str, max_results: Optional[int] = None) -> List[VideoSearchResult]:
     """
     Search YouTube for videos matching the query.
     
     Args:
         query: The search term to look for on YouTube
-        max_results: Maximum number of results to return (optional, defaults to all results)
+        max_results: Maximum number of results to return (optional, defaults to 20;
+            0 returns no results)
         
     Returns:
-        List of dictionaries containing video titles, IDs, and URLs.
+        List of search hits with video titles, IDs, and URLs.
         
     Raises:
         ToolExecutionError: If search fails.
     """
+    if max_results == 0:
+        return []
+    
+    limit = max_results if max_results is not None and max_results > 0 else YouTubeConfig.SEARCH_DEFAULT_RESULTS
     try:
-        s = youtube_search(query)
-        results = [
-            {
-                "title": yt.title,
-                "video_id": yt.video_id,
-                "url": f"https://youtu.be/{yt.video_id}"
-            }
-            for yt in s.results
+        # One flat search request, without fetching each result's watch page;
+        # results change over time, so the info caches are bypassed
+        info = _extract_info_uncached(f"ytsearch{limit}:{query}", flat=True)
+        return [
+            VideoSearchResult(
+                title=entry.get('title'),
+                video_id=entry['id'],
+                url=f"https://youtu.be/{entry['id']}"
+            )
+            for entry in islice(info.get('entries') or [], limit)
+            if entry and entry.get('id')
         ]
-        
-        if max_results is not None and max_results > 0:
-            return results[:max_results]
-        
-        return results
     except Exception as e:
         error_msg = f"Failed to search YouTube for '{query}': {str(e)}"
         logger.error(error_msg)
         raise ToolExecutionError(error_msg)
 
 
+# (result key, yt-dlp key, default) in result order; dates are reformatted and
+# list fields get fresh empty lists afterwards
+_METADATA_FIELDS = (
+    # Basic info
+    ('title', 'title', None),
+    ('views', 'view_count', None),
+    ('duration', 'duration', None),
+    ('channel', 'uploader', None),
+    ('likes', 'like_count', None),
+    ('comments', 'comment_count', None),
+    ('chapters', 'chapters', None),
+    
+    # Enhanced metadata
+    ('description', 'description', None),
+    ('tags', 'tags', None),
+    ('categories', 'categories', None),
+    ('upload_date', 'upload_date', None),
+    ('upload_date_raw', 'upload_date', None),
+    ('release_date', 'release_date', None),
+    
+    # Channel information
+    ('channel_id', 'channel_id', None),
+    ('channel_url', 'channel_url', None),
+    ('channel_follower_count', 'channel_follower_count', None),
+    ('uploader_id', 'uploader_id', None),
+    ('uploader_url', 'uploader_url', None),
+    
+    # Content details
+    ('age_limit', 'age_limit', None),
+    ('is_live', 'is_live', False),
+    ('was_live', 'was_live', False),
+    ('live_status', 'live_status', None),
+    ('language', 'language', None),
+    ('license', 'license', None),
+    
+    # Additional metadata
+    ('availability', 'availability', None),
+    ('webpage_url', 'webpage_url', None),
+    ('original_url', 'original_url', None),
+)
+_METADATA_LIST_FIELDS = ('chapters', 'tags', 'categories')
+
+
+def _metadata_from_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Project the video metadata fields from a yt-dlp info dict."""
+    metadata = {key: info.get(source, default) for key, source, default in _METADATA_FIELDS}
+    # Missing list fields get a new list per result rather than a shared default
+    for key in _METADATA_LIST_FIELDS:
+        if key not in info:
+            metadata[key] = []
+    metadata['upload_date'] = _format_upload_date(metadata['upload_date'])
+    metadata['release_date'] = _format_upload_date(metadata['release_date'])
+    return metadata
+
+
 @tool
 def get_full_metadata(url: str) -> dict:
     """
@@ -186,49 +627,7 @@ def get_full_metadata(url: str) -> dict:
         ToolExecutionError: If metadata extraction fails.
     """
     try:
-        info = _extract_info_with_ytdlp(url)
-        
-        # Format upload date if available
-        upload_date_formatted = _format_upload_date(info.get('upload_date'))
-        
-        return {
-            # Basic info
-            'title': info.get('title'),
-            'views': info.get('view_count'),
-            'duration': info.get('duration'),
-            'channel': info.get('uploader'),
-            'likes': info.get('like_count'),
-            'comments': info.get('comment_count'),
-            'chapters': info.get('chapters', []),
-            
-            # Enhanced metadata
-            'description': info.get('description'),
-            'tags': info.get('tags', []),
-            'categories': info.get('categories', []),
-            'upload_date': upload_date_formatted,
-            'upload_date_raw': info.get('upload_date'),
-            'release_date': _format_upload_date(info.get('release_date')),
-            
-            # Channel information
-            'channel_id': info.get('channel_id'),
-            'channel_url': info.get('channel_url'),
-            'channel_follower_count': info.get('channel_follower_count'),
-            'uploader_id': info.get('uploader_id'),
-            'uploader_url': info.get('uploader_url'),
-            
-            # Content details
-            'age_limit': info.get('age_limit'),
-            'is_live': info.get('is_live', False),
-            'was_live': info.get('was_live', False),
-            'live_status': info.get('live_status'),
-            'language': info.get('language'),
-            'license': info.get('license'),
-            
-            # Additional metadata
-            'availability': info.get('availability'),
-            'webpage_url': info.get('webpage_url'),
-            'original_url': info.get('original_url'),
-        }
+        return _metadata_from_info(_extract_info_with_ytdlp(url))
     except VideoNotFoundError:
         raise
     except Exception as e:
@@ -290,7 +689,8 @@ def get_playlist_info(url: str) -> Dict[str, Any]:
         ToolExecutionError: If playlist info extraction fails.
     """
     try:
-        info = _extract_info_with_ytdlp(url)
+        # A flat listing is enough to count entries without resolving each video
+        info = _extract_info_with_ytdlp(url, flat=True)
         
         # For playlists, yt-dlp returns entries as a list
         entries = info.get('entries', [])
@@ -313,54 +713,167 @@ def get_playlist_info(url: str) -> Dict[str, Any]:
         raise ToolExecutionError(error_msg)
 
 
+@dataclass(slots=True)
+class PlaylistEntry:
+    """A single video in a playlist listing."""
+    
+    title: Optional[str]
+    video_id: Optional[str]
+    url: Optional[str]
+    position: int
+    duration: Optional[int] = None
+    channel: Optional[str] = None
+
+
+def _playlist_videos_ytdlp(url: str) -> List[PlaylistEntry]:
+    """List playlist videos with yt-dlp from a single flat playlist fetch."""
+    info = _extract_info_with_ytdlp(url, flat=True)
+    return [
+        PlaylistEntry(
+            title=entry.get('title'),
+            video_id=entry.get('id'),
+            url=entry.get('webpage_url') or entry.get('url'),
+            position=idx + 1,
+            duration=entry.get('duration'),
+            channel=entry.get('uploader') or entry.get('channel'),
+        )
+        for idx, entry in enumerate(info.get('entries') or [])
+        if entry
+    ]
+
+
+def _playlist_videos_pytube(url: str) -> List[PlaylistEntry]:
+    """List playlist videos with pytube, up to PLAYLIST_FALLBACK_MAX_VIDEOS."""
+    playlist = Playlist(url)
+    return [
+        PlaylistEntry(
+            title=video.title,
+            video_id=video.video_id,
+            url=video.watch_url,
+            position=idx + 1
+        )
+        for idx, video in enumerate(islice(playlist.videos, YouTubeConfig.PLAYLIST_FALLBACK_MAX_VIDEOS))
+    ]
+
+
+_PLAYLIST_PROVIDERS = {
+    "yt-dlp": _playlist_videos_ytdlp,
+    "pytube": _playlist_videos_pytube,
+}
+_PROVIDER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4,
+    thread_name_prefix="playlist-provider"
+)
+# Fallback crawls cannot be interrupted once running, so they get their own
+# workers and never hold up the yt-dlp listings
+_FALLBACK_PROVIDER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2,
+    thread_name_prefix="playlist-fallback"
+)
+# Playlists that yt-dlp last listed successfully, so later calls skip the race.
+# pytube is never remembered: its crawl is capped and would truncate the listing
+_PLAYLIST_WINNERS: LRUCache = LRUCache(maxsize=CacheConfig.TOOL_RESULT_MAXSIZE)
+_PLAYLIST_WINNERS_LOCK = threading.Lock()
+
+
+def _first_listing(
+    futures: Dict[Any, str],
+    url: str,
+    errors: Dict[str, Exception],
+    timeout: Optional[float] = None
+) -> List[PlaylistEntry]:
+    """
+    Wait for the first provider future that delivers a non-empty listing.
+    
+    Failures are recorded in errors. Returns an empty list if no provider
+    delivers, and raises FuturesTimeoutError if the timeout passes first.
+    """
+    for future in as_completed(futures, timeout=timeout):
+        name = futures[future]
+        try:
+            videos = future.result()
+        except Exception as e:
+            logger.warning(f"Playlist provider {name} failed for {url}: {e}")
+            errors[name] = e
+            continue
+        if videos:
+            if name == "yt-dlp":
+                with _PLAYLIST_WINNERS_LOCK:
+                    _PLAYLIST_WINNERS[url] = name
+            return videos
+    return []
+
+
+def _race_playlist_providers(url: str) -> List[PlaylistEntry]:
+    """
+    List a playlist with yt-dlp, hedging with pytube only when yt-dlp falls short.
+    
+    pytube starts once yt-dlp fails, returns nothing, or is still running after
+    PLAYLIST_FALLBACK_DELAY_SECONDS; the two then race for the first non-empty
+    listing. A running crawl cannot be interrupted, so it is capped in length.
+    
+    Raises:
+        VideoNotFoundError, ToolExecutionError: If no provider delivers videos
+            and yt-dlp failed
+    """
+    errors: Dict[str, Exception] = {}
+    primary = {_PROVIDER_EXECUTOR.submit(_PLAYLIST_PROVIDERS["yt-dlp"], url): "yt-dlp"}
+    timed_out = False
+    try:
+        videos = _first_listing(primary, url, errors, timeout=YouTubeConfig.PLAYLIST_FALLBACK_DELAY_SECONDS)
+    except FuturesTimeoutError:
+        timed_out = True
+        videos = []
+    if videos:
+        return videos
+    
+    futures = {_FALLBACK_PROVIDER_EXECUTOR.submit(_PLAYLIST_PROVIDERS["pytube"], url): "pytube"}
+    if timed_out:
+        # yt-dlp is still running and may yet win the race
+        futures.update(primary)
+    videos = _first_listing(futures, url, errors)
+    if videos:
+        return videos
+    
+    # yt-dlp is the authoritative provider, so its failure is the one reported
+    if "yt-dlp" in errors:
+        raise errors["yt-dlp"]
+    return []
+
+
 @tool
-def get_playlist_videos(url: str) -> List[Dict[str, Any]]:
+def get_playlist_videos(url: str, include_details: bool = False) -> List[PlaylistEntry]:
     """
     Get list of videos in a YouTube playlist.
     
     Args:
         url: YouTube playlist URL
+        include_details: Resolve every video to fill in exact duration and channel
+            (slower; one extra request per video)
         
     Returns:
-        List of dictionaries containing video information (title, ID, URL, position).
+        List of playlist entries (title, video_id, url, position, duration, channel).
         
     Raises:
         VideoNotFoundError: If playlist is not found.
         ToolExecutionError: If playlist video extraction fails.
     """
     try:
-        info = _extract_info_with_ytdlp(url)
-        entries = info.get('entries', [])
-        
-        if not entries:
-            # Try using pytube as fallback
+        with _PLAYLIST_WINNERS_LOCK:
+            winner = _PLAYLIST_WINNERS.get(url)
+        videos: List[PlaylistEntry] = []
+        if winner is not None:
             try:
-                playlist = Playlist(url)
-                return [
-                    {
-                        'title': video.title,
-                        'video_id': video.video_id,
-                        'url': video.watch_url,
-                        'position': idx + 1
-                    }
-                    for idx, video in enumerate(playlist.videos)
-                ]
-            except Exception as pytube_error:
-                logger.warning(f"Pytube fallback failed: {pytube_error}")
-                return []
-        
-        videos = []
-        for idx, entry in enumerate(entries):
-            if entry:
-                videos.append({
-                    'title': entry.get('title'),
-                    'video_id': entry.get('id'),
-                    'url': entry.get('webpage_url') or entry.get('url'),
-                    'position': idx + 1,
-                    'duration': entry.get('duration'),
-                    'channel': entry.get('uploader') or entry.get('channel'),
-                })
+                videos = _PLAYLIST_PROVIDERS[winner](url)
+            except Exception as e:
+                logger.warning(f"Cached playlist provider {winner} failed for {url}: {e}")
+            if not videos:
+                logger.debug(f"Cached playlist provider {winner} returned nothing for {url}")
+        if not videos:
+            videos = _race_playlist_providers(url)
         
+        if include_details and videos:
+            _add_video_details(videos)
         return videos
     except VideoNotFoundError:
         raise
@@ -370,6 +883,217 @@ def get_playlist_videos(url: str) -> List[Dict[str, Any]]:
         raise ToolExecutionError(error_msg)
 
 
+# Dedicated threads for bulk fan-out, so blocking fetches never occupy the
+# event loop's default executor
+_FANOUT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=YouTubeConfig.PLAYLIST_METADATA_CONCURRENCY,
+    thread_name_prefix="yt-fanout"
+)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """
+    Check whether a request failed with HTTP 429.
+    
+    The HTTP status is read from the wrapped errors where available: yt-dlp
+    keeps them in exc_info and cause, requests on the response. Bare "429"
+    is never matched in the message, since URLs and video IDs can contain it.
+    """
+    pending: List[Any] = [error]
+    seen = set()
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        response = getattr(current, 'response', None)
+        status = getattr(current, 'status', None) or getattr(response, 'status_code', None)
+        if status == 429:
+            return True
+        exc_info = getattr(current, 'exc_info', None)
+        pending += [
+            current.__cause__,
+            current.__context__,
+            getattr(current, 'cause', None),
+            exc_info[1] if isinstance(exc_info, tuple) and len(exc_info) > 1 else None,
+        ]
+    message = str(error)
+    return "HTTP Error 429" in message or "Too Many Requests" in message
+
+
+async def _arun_with_backoff(semaphore: asyncio.Semaphore, func: Any, *args: Any) -> Any:
+    """
+    Run a blocking fetch on the fan-out executor, backing off when rate limited.
+    
+    The semaphore is held while backing off, so a rate-limited fan-out slows
+    down as a whole instead of immediately issuing more requests.
+    """
+    loop = asyncio.get_running_loop()
+    delay = YouTubeConfig.RATE_LIMIT_BACKOFF_SECONDS
+    async with semaphore:
+        for attempt in range(YouTubeConfig.RATE_LIMIT_RETRIES):
+            try:
+                return await loop.run_in_executor(_FANOUT_EXECUTOR, func, *args)
+            except ToolExecutionError as e:
+                if not _is_rate_limited(e):
+                    raise
+                logger.warning(f"Rate limited while fetching {args}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                delay *= 2
+        return await loop.run_in_executor(_FANOUT_EXECUTOR, func, *args)
+
+
+async def _afetch_from_info(
+    urls: List[str],
+    build: Callable[[str, Dict[str, Any]], Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Extract several videos concurrently and build a result from each info dict.
+    
+    Results keep the input order. Videos that fail contain url and error.
+    """
+    semaphore = asyncio.Semaphore(YouTubeConfig.PLAYLIST_METADATA_CONCURRENCY)
+    
+    async def _one(position: int, url: str) -> Tuple[int, Dict[str, Any]]:
+        try:
+            info = await _arun_with_backoff(semaphore, _extract_info_with_ytdlp, url)
+            return position, build(url, info)
+        except (VideoNotFoundError, ToolExecutionError) as e:
+            return position, {'url': url, 'error': str(e)}
+    
+    results: List[Any] = [None] * len(urls)
+    for coro in asyncio.as_completed([_one(idx, url) for idx, url in enumerate(urls)]):
+        position, result = await coro
+        results[position] = result
+    return results
+
+
+async def _afetch_metadata(urls: List[str]) -> List[Dict[str, Any]]:
+    """Fetch metadata for several videos concurrently, preserving input order."""
+    return await _afetch_from_info(urls, lambda url, info: _metadata_from_info(info))
+
+
+def _fetch_metadata_bulk(urls: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get full metadata for several YouTube videos concurrently.
+    
+    Args:
+        urls: YouTube video URLs (any format)
+    
+    Returns:
+        List of metadata dictionaries (same fields as get_full_metadata), in
+        input order. Videos that fail contain url and error.
+    """
+    return asyncio.run(_afetch_metadata(urls))
+
+
+get_full_metadata_bulk = StructuredTool.from_function(
+    func=_fetch_metadata_bulk,
+    coroutine=_afetch_metadata,
+    name="get_full_metadata_bulk"
+)
+
+
+def _entry_url(entry: Dict[str, Any]) -> Optional[str]:
+    """Build a watch URL for a flat playlist entry."""
+    if entry.get('id'):
+        return f"https://www.youtube.com/watch?v={entry['id']}"
+    return entry.get('webpage_url') or entry.get('url')
+
+
+def _add_video_details(videos: List[PlaylistEntry]) -> None:
+    """Fill in duration and channel for listed videos with concurrent full extractions."""
+    urls = [
+        video.url or f"https://www.youtube.com/watch?v={video.video_id}"
+        for video in videos
+    ]
+    for video, metadata in zip(videos, asyncio.run(_afetch_metadata(urls))):
+        if 'error' in metadata:
+            logger.warning(f"Could not resolve details for {video.url}: {metadata['error']}")
+            continue
+        video.duration = metadata.get('duration')
+        video.channel = metadata.get('channel')
+
+
+@tool
+def get_playlist_metadata(url: str) -> List[Dict[str, Any]]:
+    """
+    Get full metadata for every video in a YouTube playlist in one call.
+    
+    Args:
+        url: YouTube playlist URL
+    
+    Returns:
+        List of metadata dictionaries (same fields as get_full_metadata plus
+        position), in playlist order. Videos that fail contain url and error.
+    
+    Raises:
+        VideoNotFoundError: If playlist is not found.
+        ToolExecutionError: If playlist extraction fails.
+    """
+    try:
+        info = _extract_info_with_ytdlp(url, flat=True)
+        video_urls = [
+            video_url for video_url in (_entry_url(entry) for entry in info.get('entries') or [] if entry)
+            if video_url
+        ]
+        
+        metadata = asyncio.run(_afetch_metadata(video_urls))
+        for position, item in enumerate(metadata, start=1):
+            item['position'] = position
+        return metadata
+    except VideoNotFoundError:
+        raise
+    except Exception as e:
+        error_msg = f"Failed to get playlist metadata for {url}: {str(e)}"
+        logger.error(error_msg)
+        raise ToolExecutionError(error_msg)
+
+
+async def _afetch_transcripts(
+    video_ids: List[str],
+    language: str = YouTubeConfig.DEFAULT_TRANSCRIPT_LANGUAGE
+) -> List[Dict[str, Any]]:
+    """Fetch several transcripts concurrently, preserving input order."""
+    semaphore = asyncio.Semaphore(YouTubeConfig.PLAYLIST_METADATA_CONCURRENCY)
+    
+    async def _one(video_id: str) -> Dict[str, Any]:
+        try:
+            text = await _arun_with_backoff(semaphore, _fetch_transcript_text, video_id, language)
+            return {'video_id': video_id, 'transcript': text}
+        except (TranscriptNotFoundError, VideoNotFoundError, ToolExecutionError) as e:
+            return {'video_id': video_id, 'error': str(e)}
+    
+    return list(await asyncio.gather(*[_one(video_id) for video_id in video_ids]))
+
+
+def _fetch_transcripts_bulk(
+    video_ids: List[str],
+    language: str = YouTubeConfig.DEFAULT_TRANSCRIPT_LANGUAGE
+) -> List[Dict[str, Any]]:
+    """
+    Fetches the transcripts of several YouTube videos concurrently.
+    
+    Args:
+        video_ids: YouTube video IDs (e.g., ["dQw4w9WgXcQ"]).
+        language: Language code for the transcripts (e.g., "en", "es").
+    
+    Returns:
+        List of dictionaries with video_id and transcript, in input order.
+        Videos whose transcript could not be fetched contain video_id and error.
+    """
+    return asyncio.run(_afetch_transcripts(video_ids, language))
+
+
+# The coroutine lets async callers gather on their own loop instead of
+# starting a fresh one in a worker thread
+fetch_transcripts_bulk = StructuredTool.from_function(
+    func=_fetch_transcripts_bulk,
+    coroutine=_afetch_transcripts,
+    name="fetch_transcripts_bulk"
+)
+
+
 @tool
 def fetch_transcript_with_timestamps(video_id: str, language: str = YouTubeConfig.DEFAULT_TRANSCRIPT_LANGUAGE) -> List[Dict[str, Any]]:
     """
@@ -386,23 +1110,29 @@ def fetch_transcript_with_timestamps(video_id: str, language: str = YouTubeConfi
         TranscriptNotFoundError: If transcript is not available.
         ToolExecutionError: If transcript fetching fails.
     """
+    cache_key = transcript_cache_key("txt", video_id, language)
+    cached = get_cached_transcript(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        ytt_api = YouTubeTranscriptApi()
-        transcript_list = ytt_api.list_transcripts(video_id)
+        transcript_list = _get_transcript_api().list(video_id)
         
         # Try to get transcript in requested language
         try:
             transcript = transcript_list.find_transcript([language])
-        except:
-            # Fallback to any available transcript
-            transcript = transcript_list.find_transcript(transcript_list.manually_created_transcript_language_codes + 
-                                                         transcript_list.generated_transcript_language_codes)
+        except NoTranscriptFound:
+            # Fallback to the first available transcript; iteration yields
+            # manually created transcripts first, so no code list is built
+            transcript = next(iter(transcript_list), None)
+            if transcript is None:
+                raise
         
         # Get transcript with timestamps using get_transcript() which returns list of dicts
         transcript_data = transcript.fetch()
         
         # Convert TranscriptSnippet objects to dictionaries
-        return [
+        segments = [
             {
                 'text': snippet.text,
                 'start': snippet.start,
@@ -410,12 +1140,20 @@ def fetch_transcript_with_timestamps(video_id: str, language: str = YouTubeConfi
             }
             for snippet in transcript_data
         ]
+        cache_transcript(cache_key, segments)
+        return segments
+    except (NoTranscriptFound, TranscriptsDisabled) as e:
+        error_msg = f"No transcript available for video {video_id}: {str(e)}"
+        logger.error(error_msg)
+        raise TranscriptNotFoundError(error_msg) from e
+    except VideoUnavailable as e:
+        error_msg = f"Video {video_id} is unavailable: {str(e)}"
+        logger.error(error_msg)
+        raise VideoNotFoundError(error_msg) from e
     except Exception as e:
         error_msg = f"Failed to fetch transcript with timestamps for video {video_id}: {str(e)}"
         logger.error(error_msg)
-        if "No transcripts were found" in str(e) or "TranscriptsDisabled" in str(e):
-            raise TranscriptNotFoundError(error_msg)
-        raise ToolExecutionError(error_msg)
+        raise ToolExecutionError(error_msg) from e
 
 
 @tool
@@ -434,45 +1172,66 @@ def list_transcript_languages(video_id: str) -> List[Dict[str, Any]]:
         ToolExecutionError: If language listing fails.
     """
     try:
-        ytt_api = YouTubeTranscriptApi()
-        transcript_list = ytt_api.list_transcripts(video_id)
+        transcript_list = _get_transcript_api().list(video_id)
         
-        languages = []
-        
-        # Add manually created transcripts
-        for transcript in transcript_list.manually_created_transcripts.values():
-            languages.append({
-                'language_code': transcript.language_code,
-                'language': transcript.language,
-                'is_generated': False,
-                'is_translatable': transcript.is_translatable,
-            })
-        
-        # Add auto-generated transcripts
-        for transcript in transcript_list.generated_transcripts.values():
-            languages.append({
+        # Iteration yields manually created transcripts before generated ones
+        return [
+            {
                 'language_code': transcript.language_code,
                 'language': transcript.language,
-                'is_generated': True,
+                'is_generated': transcript.is_generated,
                 'is_translatable': transcript.is_translatable,
-            })
-        
-        return languages
+            }
+            for transcript in transcript_list
+        ]
+    except (NoTranscriptFound, TranscriptsDisabled) as e:
+        error_msg = f"No transcripts available for video {video_id}: {str(e)}"
+        logger.error(error_msg)
+        raise TranscriptNotFoundError(error_msg) from e
+    except VideoUnavailable as e:
+        error_msg = f"Video {video_id} is unavailable: {str(e)}"
+        logger.error(error_msg)
+        raise VideoNotFoundError(error_msg) from e
     except Exception as e:
         error_msg = f"Failed to list transcript languages for video {video_id}: {str(e)}"
         logger.error(error_msg)
-        if "No transcripts were found" in str(e) or "TranscriptsDisabled" in str(e):
-            raise TranscriptNotFoundError(error_msg)
-        raise ToolExecutionError(error_msg)
+        raise ToolExecutionError(error_msg) from e
+
+
+def _thumbnails_from_info(info: Dict[str, Any], include_resolution: bool = True) -> List[Dict[str, Any]]:
+    """Build the thumbnail list from a yt-dlp info dict."""
+    thumbnails = []
+    for t in info.get('thumbnails', []):
+        if 'url' in t:
+            width, height = t.get('width'), t.get('height')
+            thumbnail = {"url": t['url'], "width": width, "height": height}
+            if include_resolution:
+                thumbnail["resolution"] = f"{width}x{height}" if width and height else None
+            thumbnails.append(thumbnail)
+    return thumbnails
+
+
+def _thumbnail_available(url: str) -> bool:
+    """Check with a HEAD request whether a thumbnail URL serves an image."""
+    try:
+        response = SESSION.head(
+            url, timeout=HTTPConfig.THUMBNAIL_CHECK_TIMEOUT_SECONDS, allow_redirects=True
+        )
+        return response.status_code == 200
+    except requests.RequestException as e:
+        logger.debug(f"Thumbnail check failed for {url}: {e}")
+        return False
 
 
 @tool
-def get_thumbnails(url: str) -> List[Dict[str, Any]]:
+def get_thumbnails(url: str, verify: bool = False, include_resolution: bool = True) -> List[Dict[str, Any]]:
     """
     Get available thumbnails for a YouTube video using its URL.
     
     Args:
         url: YouTube video URL (any format)
+        verify: Drop thumbnails whose URL does not respond with 200 OK
+        include_resolution: Add a "WIDTHxHEIGHT" resolution string to each thumbnail
         
     Returns:
         List of dictionaries with thumbnail URLs and resolutions.
@@ -481,28 +1240,44 @@ def get_thumbnails(url: str) -> List[Dict[str, Any]]:
         VideoNotFoundError: If video is not found.
         ToolExecutionError: If thumbnail extraction fails.
     """
-    yt_dlp_logger = _get_suppressed_yt_dlp_logger()
-
     try:
-        with yt_dlp.YoutubeDL({'quiet': True, 'logger': yt_dlp_logger}) as ydl:
-            info = ydl.extract_info(url, download=False)
-            if not info:
-                raise VideoNotFoundError(f"Video not found: {url}")
-            
-            thumbnails = []
-            for t in info.get('thumbnails', []):
-                if 'url' in t:
-                    thumbnails.append({
-                        "url": t['url'],
-                        "width": t.get('width'),
-                        "height": t.get('height'),
-                        "resolution": f"{t.get('width', '')}x{t.get('height', '')}".strip('x')
-                    })
-            
-            return thumbnails
+        thumbnails = _thumbnails_from_info(_extract_info_with_ytdlp(url), include_resolution)
+        if verify:
+            # YouTube lists sizes that 404; probe them all at once, not in turn
+            available = list(_FANOUT_EXECUTOR.map(_thumbnail_available, [t['url'] for t in thumbnails]))
+            thumbnails = [t for t, ok in zip(thumbnails, available) if ok]
+        return thumbnails
     except VideoNotFoundError:
         raise
     except Exception as e:
         error_msg = f"Failed to get thumbnails for {url}: {str(e)}"
         logger.error(error_msg)
         raise ToolExecutionError(error_msg)
+
+
+async def _afetch_thumbnails(urls: List[str]) -> List[Dict[str, Any]]:
+    """Fetch thumbnails for several videos concurrently, preserving input order."""
+    return await _afetch_from_info(
+        urls, lambda url, info: {'url': url, 'thumbnails': _thumbnails_from_info(info)}
+    )
+
+
+def _fetch_thumbnails_bulk(urls: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get available thumbnails for several YouTube videos concurrently.
+    
+    Args:
+        urls: YouTube video URLs (any format)
+    
+    Returns:
+        List of dictionaries with url and thumbnails (same entries as
+        get_thumbnails), in input order. Videos that fail contain url and error.
+    """
+    return asyncio.run(_afetch_thumbnails(urls))
+
+
+get_thumbnails_bulk = StructuredTool.from_function(
+    func=_fetch_thumbnails_bulk,
+    coroutine=_afetch_thumbnails,
+    name="get_thumbnails_bulk"
+)
@@ -1,6 +1,7 @@
 """Utilities module."""
 
 from src.utils.logging import setup_logging, get_logger
+from src.utils.serialization import dumps_json, loads_json
 from src.utils.exceptions import (
     YouTubeInteractionError,
     YouTubeToolError,
@@ -14,6 +15,8 @@ from src.utils.exceptions import (
 __all__ = [
     "setup_logging",
     "get_logger",
+    "dumps_json",
+    "loads_json",
     "YouTubeInteractionError",
     "YouTubeToolError",
     "VideoNotFoundError",
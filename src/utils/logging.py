@@ -2,7 +2,6 @@
 
 import logging
 import warnings
-from typing import List
 
 from src.core.constants import LoggingConfig
 
@@ -18,16 +17,25 @@ def setup_logging(
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         suppress_third_party: Whether to suppress third-party library logs
     """
+    numeric_level = getattr(logging, level.upper())
+    
     # Configure root logger
     logging.basicConfig(
-        level=getattr(logging, level.upper()),
+        level=numeric_level,
         format=LoggingConfig.LOG_FORMAT,
         datefmt=LoggingConfig.DATE_FORMAT,
         force=True  # Override any existing configuration
     )
     
-    # Suppress warnings
-    warnings.filterwarnings("ignore")
+    # Hide deprecation noise from known dependencies unless debugging; other
+    # warnings, including our own deprecations, still surface
+    if numeric_level >= logging.INFO:
+        for module_name in LoggingConfig.DEPRECATION_WARNING_MODULES:
+            warnings.filterwarnings(
+                "ignore",
+                category=DeprecationWarning,
+                module=rf"{module_name}(\.|$)"
+            )
     
     # Suppress third-party library logs if requested
     if suppress_third_party:
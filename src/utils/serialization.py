@@ -0,0 +1,62 @@
+"""JSON serialization helpers."""
+
+import dataclasses
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if orjson is not None:
+    _DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Convert values the JSON encoders cannot handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+def dumps_json(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize an object to a compact JSON string, using orjson when installed.
+    
+    Pydantic models and dataclasses are expanded into objects; other values
+    that cannot be serialized natively are converted with str, matching
+    json.dumps(obj, default=str).
+    
+    Args:
+        obj: Object to serialize
+        sort_keys: Whether to emit dictionary keys in sorted order
+    
+    Returns:
+        JSON string
+    """
+    if orjson is None:
+        return json.dumps(
+            obj, default=_default, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":")
+        )
+    option = _DUMPS_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _DUMPS_OPTIONS
+    return orjson.dumps(obj, default=_default, option=option).decode()
+
+
+def loads_json(data: Any) -> Any:
+    """
+    Deserialize JSON from str or bytes, using orjson when installed.
+    
+    Args:
+        data: JSON document
+    
+    Returns:
+        Deserialized object
+    """
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
@@ -1,9 +1,46 @@
 """Pytest configuration and fixtures."""
 
+import os
+
 import pytest
 from unittest.mock import Mock, MagicMock
 
 from src.config.settings import Settings
+from src.processing.limits import get_rate_limiter
+from src.tools.cache import clear_tool_cache, clear_transcript_cache
+from src.tools.youtube import (
+    _INFO_MEMO,
+    _PLAYLIST_WINNERS,
+    _close_ydl_pools,
+    _find_video_id,
+    _get_transcript_api,
+)
+
+# Settings are validated lazily by code under test; provide a dummy key so unit
+# tests never depend on the developer's environment
+os.environ.setdefault("GOOGLE_API_KEY", "test_api_key")
+# Keep unit tests from reading or writing the developer's yt-dlp disk cache
+os.environ.setdefault("YT_CACHE_DISABLE", "1")
+
+
+@pytest.fixture(autouse=True)
+def _reset_tool_caches():
+    """Keep cached tool results from leaking between tests."""
+    clear_tool_cache()
+    clear_transcript_cache()
+    yield
+    clear_tool_cache()
+    clear_transcript_cache()
+    _PLAYLIST_WINNERS.clear()
+    _INFO_MEMO.clear()
+    # Video ID lookups may have been memoized under a patched scan backend
+    _find_video_id.cache_clear()
+    # Pooled YoutubeDL instances may have been created from a patched class
+    _close_ydl_pools()
+    # The shared transcript client may have been created from a patched class
+    _get_transcript_api.cache_clear()
+    # Start every test with a full token bucket
+    get_rate_limiter.cache_clear()
 
 
 @pytest.fixture
@@ -23,6 +23,9 @@ def test_query_endpoint_success(monkeypatch) -> None:
         def invoke(self, _input):
             return ["dummy", type("Msg", (), {"content": "ok"})()]
 
+        async def ainvoke(self, _input):
+            return self.invoke(_input)
+
     # Ensure chain is present
     app.state.chain = DummyChain()
 
@@ -32,3 +35,36 @@ def test_query_endpoint_success(monkeypatch) -> None:
     assert "result" in body
     assert isinstance(body["result"], str)
 
+
+def test_query_stream_endpoint(monkeypatch) -> None:
+    """POST /query/stream should emit each chunk as a server-sent event."""
+
+    class DummyStreamingChain:
+        async def astream(self, _input):
+            for chunk in ("Hello", " world"):
+                yield chunk
+
+    app.state.streaming_chain = DummyStreamingChain()
+
+    response = client.post("/query/stream", json={"query": "test query"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'data: "Hello"\n\n'
+        'data: " world"\n\n'
+        "event: end\ndata: {}\n\n"
+    )
+
+
+def test_query_batch_endpoint() -> None:
+    """POST /query/batch should return one result per query, in order."""
+
+    class EchoChain:
+        async def ainvoke(self, input_):
+            return [type("Msg", (), {"content": input_["query"].upper()})()]
+
+    app.state.chain = EchoChain()
+
+    response = client.post("/query/batch", json={"queries": ["a", "b", "c"]})
+    assert response.status_code == 200
+    assert response.json() == {"results": ["A", "B", "C"]}
@@ -0,0 +1,80 @@
+"""Unit tests for the batch meta-tool."""
+
+import json
+from unittest.mock import Mock, patch
+
+from src.tools.batch import batch_tool
+
+
+class TestBatchTool:
+    """Tests for batch_tool."""
+    
+    @patch('src.processing.executor.get_tool')
+    def test_batch_tool_preserves_order(self, mock_get_tool):
+        """Test batch results are returned in invocation order."""
+        mock_tool = Mock()
+        mock_tool.invoke.side_effect = lambda args: f"value {args['value']}"
+        mock_get_tool.return_value = mock_tool
+        
+        invocations = [
+            {"tool_name": "test_tool", "arguments": {"value": i}} for i in range(5)
+        ]
+        result = json.loads(batch_tool.invoke({"invocations": invocations}))
+        
+        assert [r["result"] for r in result] == [f"value {i}" for i in range(5)]
+        assert all(r["tool_name"] == "test_tool" for r in result)
+    
+    @patch('src.processing.executor.get_tool')
+    def test_batch_tool_nests_structured_results(self, mock_get_tool):
+        """Test dict results come back as nested objects, not escaped JSON strings."""
+        mock_tool = Mock()
+        mock_tool.invoke.return_value = {"title": "Video", "tags": ["a", "b"]}
+        mock_get_tool.return_value = mock_tool
+        
+        invocations = [{"tool_name": "get_full_metadata", "arguments": {"url": "https://youtu.be/dQw4w9WgXcQ"}}]
+        result = json.loads(batch_tool.invoke({"invocations": invocations}))
+        
+        assert result[0]["result"] == {"title": "Video", "tags": ["a", "b"]}
+    
+    @patch('src.processing.executor.get_rate_limiter')
+    @patch('src.processing.executor.get_tool')
+    def test_invocations_are_deduplicated_cached_and_rate_limited(self, mock_get_tool, mock_limiter):
+        """Test each unique invocation takes a rate-limit token and cacheable results are reused."""
+        mock_tool = Mock()
+        mock_tool.invoke.side_effect = lambda args: args["url"][-11:]
+        mock_get_tool.return_value = mock_tool
+        
+        invocations = [
+            {"tool_name": "extract_video_id", "arguments": {"url": "https://youtu.be/dQw4w9WgXcQ"}},
+            {"tool_name": "extract_video_id", "arguments": {"url": "https://youtu.be/dQw4w9WgXcQ"}},
+            {"tool_name": "extract_video_id", "arguments": {"url": "https://youtu.be/aaaaaaaaaaa"}},
+        ]
+        result = json.loads(batch_tool.invoke({"invocations": invocations}))
+        assert [r["result"] for r in result] == ["dQw4w9WgXcQ", "dQw4w9WgXcQ", "aaaaaaaaaaa"]
+        assert mock_tool.invoke.call_count == 2
+        assert mock_limiter.return_value.acquire_sync.call_count == 2
+        
+        batch_tool.invoke({"invocations": invocations[:1]})
+        assert mock_tool.invoke.call_count == 2
+    
+    def test_batch_tool_reports_errors_per_invocation(self):
+        """Test a failing invocation does not cancel its siblings."""
+        invocations = [
+            {"tool_name": "extract_video_id", "arguments": {"url": "https://youtu.be/dQw4w9WgXcQ"}},
+            {"tool_name": "non_existent_tool", "arguments": {}},
+        ]
+        result = json.loads(batch_tool.invoke({"invocations": invocations}))
+        
+        assert result[0]["result"] == "dQw4w9WgXcQ"
+        assert "error" in result[1]
+    
+    def test_batch_tool_rejects_nesting(self):
+        """Test batch_tool cannot invoke itself."""
+        invocations = [{"tool_name": "batch_tool", "arguments": {"invocations": []}}]
+        result = json.loads(batch_tool.invoke({"invocations": invocations}))
+        
+        assert "error" in result[0]
+    
+    def test_batch_tool_empty(self):
+        """Test an empty batch returns an empty list."""
+        assert json.loads(batch_tool.invoke({"invocations": []})) == []
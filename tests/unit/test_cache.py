@@ -0,0 +1,130 @@
+"""Unit tests for tool and transcript caching."""
+
+import zlib
+
+import diskcache
+import orjson
+
+import src.tools.cache as cache
+from src.tools.cache import (
+    cache_result,
+    cache_missing_transcript,
+    cache_transcript,
+    clear_tool_cache,
+    get_cached_result,
+    get_cached_transcript,
+    get_missing_transcript,
+    get_transcript_cache_stats,
+    transcript_cache_key,
+)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client."""
+    
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+    
+    def get(self, key):
+        return self.store.get(key)
+    
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+
+class TestToolResultCache:
+    """Tests for the tool result cache."""
+    
+    def test_uncacheable_tools_are_skipped(self):
+        """Test results of tools outside CACHEABLE_TOOLS are never stored."""
+        cache_result("search_youtube", {"query": "a"}, "[]")
+        assert get_cached_result("search_youtube", {"query": "a"}) is None
+    
+    def test_force_refresh_skips_lookup(self):
+        """Test a call asking for a refresh is not served from the cache."""
+        cache_result("fetch_transcript", {"video_id": "a"}, "old")
+        assert get_cached_result("fetch_transcript", {"video_id": "a", "force_refresh": True}) is None
+    
+    def test_force_refresh_result_replaces_normal_entry(self):
+        """Test a refreshed result is stored under the arguments without force_refresh."""
+        cache_result("fetch_transcript", {"video_id": "a"}, "old")
+        cache_result("fetch_transcript", {"video_id": "a", "force_refresh": True}, "new")
+        assert get_cached_result("fetch_transcript", {"video_id": "a"}) == "new"
+    
+    def test_disk_layer_survives_memory_clear(self, monkeypatch, tmp_path):
+        """Test results written to the disk layer are served after the memory cache is dropped."""
+        disk = diskcache.Cache(str(tmp_path))
+        monkeypatch.setattr(cache, "_get_tool_disk_cache", lambda: disk)
+        args = {"url": "https://youtu.be/dQw4w9WgXcQ"}
+        
+        cache_result("get_thumbnails", args, "[]")
+        clear_tool_cache()
+        
+        assert get_cached_result("get_thumbnails", args) == "[]"
+        disk.close()
+
+
+class TestTranscriptCache:
+    """Tests for the transcript cache."""
+    
+    def test_key_format(self):
+        """Test keys are namespaced by kind, video and language."""
+        assert transcript_cache_key("tx", "abc", "en") == "yt:tx:abc:en"
+    
+    def test_local_round_trip(self, monkeypatch):
+        """Test transcripts are cached in-process without Redis."""
+        monkeypatch.setattr(cache, "_get_redis_client", lambda: None)
+        key = transcript_cache_key("txt", "abc", "en")
+        segments = [{"text": "hi", "start": 0.0, "duration": 1.5}]
+        
+        assert get_cached_transcript(key) is None
+        cache_transcript(key, segments)
+        assert get_cached_transcript(key) == segments
+    
+    def test_redis_round_trip_is_compressed(self, monkeypatch):
+        """Test Redis entries are zlib-compressed and stored with the TTL."""
+        client = FakeRedis()
+        monkeypatch.setattr(cache, "_get_redis_client", lambda: client)
+        key = transcript_cache_key("tx", "abc", "en")
+        
+        cache_transcript(key, "hello world")
+        
+        assert orjson.loads(zlib.decompress(client.store[key])) == "hello world"
+        assert client.ttls[key] == cache.CacheConfig.TRANSCRIPT_TTL_SECONDS
+        assert get_cached_transcript(key) == "hello world"
+    
+    def test_missing_transcripts_use_separate_short_lived_keys(self, monkeypatch):
+        """Test negative entries live outside the yt:tx: namespace with their own TTL."""
+        client = FakeRedis()
+        monkeypatch.setattr(cache, "_get_redis_client", lambda: client)
+        key = transcript_cache_key("txneg", "abc", "en")
+        
+        cache_missing_transcript(key, "No transcript available")
+        
+        assert key == "yt:txneg:abc:en"
+        assert get_missing_transcript(key) == "No transcript available"
+        assert get_cached_transcript(transcript_cache_key("tx", "abc", "en")) is None
+        assert not any(stored.startswith("yt:tx:") for stored in client.store)
+        assert client.ttls[key] == cache.CacheConfig.TRANSCRIPT_NEGATIVE_TTL_SECONDS
+    
+    def test_redis_errors_are_misses(self, monkeypatch):
+        """Test a failing Redis read is treated as a cache miss."""
+        client = FakeRedis()
+        client.get = lambda key: (_ for _ in ()).throw(ConnectionError("down"))
+        monkeypatch.setattr(cache, "_get_redis_client", lambda: client)
+        
+        assert get_cached_transcript("yt:tx:abc:en") is None
+
+    def test_hits_and_misses_are_counted(self, monkeypatch):
+        """Test lookups update the hit and miss counters."""
+        monkeypatch.setattr(cache, "_get_redis_client", lambda: None)
+        key = transcript_cache_key("tx", "abc", "en")
+
+        get_cached_transcript(key)
+        cache_transcript(key, "hello")
+        get_cached_transcript(key)
+        get_cached_transcript(key)
+
+        assert get_transcript_cache_stats() == {"hits": 2, "misses": 1}
@@ -0,0 +1,70 @@
+"""Unit tests for tool execution limits."""
+
+import asyncio
+import time
+
+from src.processing.limits import TokenBucket, get_tool_semaphore
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket rate limiter."""
+    
+    def test_burst_within_capacity_does_not_wait(self):
+        """Test acquisitions up to capacity return immediately."""
+        bucket = TokenBucket(rate_per_minute=60, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire_sync()
+        assert time.monotonic() - start < 0.1
+    
+    def test_empty_bucket_waits_for_refill(self):
+        """Test acquiring from an empty bucket waits for a token."""
+        bucket = TokenBucket(rate_per_minute=1200, capacity=1)  # one token per 50ms
+        bucket.acquire_sync()
+        start = time.monotonic()
+        bucket.acquire_sync()
+        assert time.monotonic() - start >= 0.03
+    
+    def test_async_acquire_waits_for_refill(self):
+        """Test the async acquire path also respects the rate."""
+        bucket = TokenBucket(rate_per_minute=1200, capacity=1)
+        
+        async def acquire_twice():
+            await bucket.acquire()
+            start = time.monotonic()
+            await bucket.acquire()
+            return time.monotonic() - start
+        
+        assert asyncio.run(acquire_twice()) >= 0.03
+    
+    def test_zero_rate_disables_limit(self):
+        """Test a non-positive rate never blocks."""
+        bucket = TokenBucket(rate_per_minute=0)
+        start = time.monotonic()
+        for _ in range(100):
+            bucket.acquire_sync()
+        assert time.monotonic() - start < 0.1
+
+
+class TestToolSemaphore:
+    """Tests for the per-loop tool semaphore."""
+    
+    def test_separate_event_loops_each_get_a_semaphore(self, monkeypatch):
+        """Test contending on the semaphore works again from a fresh event loop."""
+        import src.processing.limits as limits
+        
+        monkeypatch.setattr(limits.get_settings(), "max_tool_concurrency", 2)
+        
+        async def contend():
+            semaphore = get_tool_semaphore()
+            
+            async def hold():
+                async with semaphore:
+                    await asyncio.sleep(0)
+            
+            await asyncio.gather(*[hold() for _ in range(20)])
+            return semaphore
+        
+        first = asyncio.run(contend())
+        second = asyncio.run(contend())
+        assert first is not second
@@ -1,15 +1,22 @@
 """Unit tests for tool processing."""
 
+import asyncio
+import json
+from decimal import Decimal
+
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 
 from src.processing.executor import (
     execute_tool,
+    execute_tool_async,
     process_tool_calls,
+    process_tool_calls_async,
     should_continue,
+    astream_recursive_chain,
     _recursive_chain
 )
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
 
 
 class TestExecuteTool:
@@ -32,6 +39,90 @@ class TestExecuteTool:
         assert result.tool_call_id == "call_123"
         assert "success" in result.content
     
+    @patch('src.processing.executor.get_tool')
+    def test_execute_tool_serializes_non_json_values(self, mock_get_tool):
+        """Test non-string keys and non-JSON values are serialized."""
+        mock_tool = Mock()
+        mock_tool.invoke.return_value = {1: Decimal("1.5"), "tags": ["a"]}
+        mock_get_tool.return_value = mock_tool
+        
+        result = execute_tool({"name": "test_tool", "args": {}, "id": "call_123"})
+        assert json.loads(result.content) == {"1": "1.5", "tags": ["a"]}
+    
+    @patch('src.processing.executor.get_tool')
+    def test_execute_tool_coerces_by_result_type(self, mock_get_tool):
+        """Test strings pass through, bytes are decoded and dict subclasses become JSON."""
+        from collections import OrderedDict
+        
+        mock_tool = Mock()
+        mock_get_tool.return_value = mock_tool
+        expected = {"text": "text", b"bytes": "bytes", 42: "42"}
+        for value, content in expected.items():
+            mock_tool.invoke.return_value = value
+            assert execute_tool({"name": "test_tool", "args": {}, "id": "c"}).content == content
+        
+        mock_tool.invoke.return_value = OrderedDict(a=1)
+        assert json.loads(execute_tool({"name": "test_tool", "args": {}, "id": "c"}).content) == {"a": 1}
+    
+    def test_stdlib_fallback_matches_orjson(self, monkeypatch):
+        """Test the json fallback emits the same document as orjson."""
+        import src.utils.serialization as serialization
+        from src.tools.youtube import PlaylistEntry
+        
+        value = {"b": Decimal("1.5"), "a": "ü"}
+        entry = PlaylistEntry(title="x", video_id="x", url=None, position=1)
+        expected = serialization.dumps_json(value, sort_keys=True)
+        expected_entry = serialization.dumps_json(entry)
+        
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert serialization.dumps_json(value, sort_keys=True) == expected
+        assert serialization.dumps_json(entry) == expected_entry
+        assert serialization.loads_json(expected) == json.loads(expected)
+    
+    @patch('src.processing.executor.get_tool')
+    def test_execute_tool_caches_idempotent_tools(self, mock_get_tool):
+        """Test cacheable tools are invoked once for repeated arguments."""
+        mock_tool = Mock()
+        mock_tool.invoke.return_value = {"title": "Test Video"}
+        mock_get_tool.return_value = mock_tool
+        
+        args = {"url": "https://youtube.com/watch?v=test"}
+        first = execute_tool({"name": "get_full_metadata", "args": args, "id": "call_1"})
+        second = execute_tool({"name": "get_full_metadata", "args": args, "id": "call_2"})
+        
+        assert mock_tool.invoke.call_count == 1
+        assert second.content == first.content
+        assert second.tool_call_id == "call_2"
+    
+    @patch('src.processing.executor.get_tool')
+    def test_force_refresh_replaces_cached_result(self, mock_get_tool):
+        """Test a refresh call updates the entry later normal calls are served from."""
+        mock_tool = Mock()
+        mock_tool.invoke.side_effect = ["old", "new"]
+        mock_get_tool.return_value = mock_tool
+        
+        args = {"video_id": "test123"}
+        contents = [
+            execute_tool({"name": "fetch_transcript", "args": call_args, "id": f"call_{idx}"}).content
+            for idx, call_args in enumerate([args, {**args, "force_refresh": True}, args])
+        ]
+        
+        assert contents == ["old", "new", "new"]
+        assert mock_tool.invoke.call_count == 2
+    
+    @patch('src.processing.executor.get_tool')
+    def test_execute_tool_skips_cache_for_search(self, mock_get_tool):
+        """Test non-idempotent tools are always invoked."""
+        mock_tool = Mock()
+        mock_tool.invoke.return_value = []
+        mock_get_tool.return_value = mock_tool
+        
+        args = {"query": "test"}
+        execute_tool({"name": "search_youtube", "args": args, "id": "call_1"})
+        execute_tool({"name": "search_youtube", "args": args, "id": "call_2"})
+        
+        assert mock_tool.invoke.call_count == 2
+    
     def test_execute_tool_missing_fields(self):
         """Test tool execution with missing fields."""
         tool_call = {"name": "test_tool"}  # Missing args and id
@@ -40,6 +131,146 @@ class TestExecuteTool:
         assert "error" in result.content.lower()
 
 
+class TestProcessToolCalls:
+    """Tests for process_tool_calls function."""
+    
+    @patch('src.processing.executor.get_tool')
+    def test_process_tool_calls_preserves_order(self, mock_get_tool):
+        """Test tool responses keep the order of the emitted tool calls."""
+        import time
+        
+        def make_tool(delay, value):
+            tool = Mock()
+            tool.invoke.side_effect = lambda args: time.sleep(delay) or value
+            return tool
+        
+        tools = {"slow": make_tool(0.05, "slow result"), "fast": make_tool(0, "fast result")}
+        mock_get_tool.side_effect = lambda name: tools[name]
+        
+        ai_message = Mock()
+        ai_message.tool_calls = [
+            {"name": "slow", "args": {}, "id": "call_1"},
+            {"name": "fast", "args": {}, "id": "call_2"},
+        ]
+        llm = Mock()
+        llm.invoke.return_value = AIMessage(content="done")
+        
+        result = process_tool_calls([ai_message], llm)
+        
+        assert [m.tool_call_id for m in result[1:3]] == ["call_1", "call_2"]
+        assert result[1].content == "slow result"
+        assert result[-1].content == "done"
+
+    @patch('src.processing.executor.get_tool')
+    def test_process_tool_calls_dedupes_identical_calls(self, mock_get_tool):
+        """Test identical calls in one turn run once and answer every call id."""
+        mock_tool = Mock()
+        mock_tool.invoke.return_value = "result"
+        mock_get_tool.return_value = mock_tool
+        
+        ai_message = Mock()
+        ai_message.tool_calls = [
+            {"name": "search_youtube", "args": {"query": "a", "max_results": 5}, "id": "call_1"},
+            {"name": "search_youtube", "args": {"max_results": 5, "query": "a"}, "id": "call_2"},
+            {"name": "search_youtube", "args": {"query": "b"}, "id": "call_3"},
+        ]
+        llm = Mock()
+        llm.invoke.return_value = AIMessage(content="done")
+        
+        result = process_tool_calls([ai_message], llm)
+        
+        assert mock_tool.invoke.call_count == 2
+        assert [m.tool_call_id for m in result[1:4]] == ["call_1", "call_2", "call_3"]
+        assert [m.content for m in result[1:4]] == ["result"] * 3
+
+    @patch('src.processing.executor.get_tool')
+    def test_process_tool_calls_runs_single_call_inline(self, mock_get_tool):
+        """Test a lone tool call runs on the calling thread instead of the pool."""
+        import threading
+
+        threads = []
+        mock_tool = Mock()
+        mock_tool.invoke.side_effect = lambda args: threads.append(threading.current_thread()) or "result"
+        mock_get_tool.return_value = mock_tool
+
+        ai_message = Mock()
+        ai_message.tool_calls = [{"name": "get_thumbnails", "args": {"url": "u"}, "id": "call_1"}]
+        llm = Mock()
+        llm.invoke.return_value = AIMessage(content="done")
+        
+        result = process_tool_calls([ai_message], llm)
+        
+        assert threads == [threading.current_thread()]
+        assert result[1].tool_call_id == "call_1"
+
+
+class TestAsyncExecution:
+    """Tests for the async tool execution path."""
+    
+    @patch('src.processing.executor.get_tool')
+    def test_execute_tool_async_success(self, mock_get_tool):
+        """Test successful async tool execution uses ainvoke."""
+        mock_tool = Mock()
+        mock_tool.ainvoke = AsyncMock(return_value={"result": "success"})
+        mock_get_tool.return_value = mock_tool
+        
+        tool_call = {"name": "test_tool", "args": {"arg1": "value1"}, "id": "call_123"}
+        
+        result = asyncio.run(execute_tool_async(tool_call))
+        assert result.tool_call_id == "call_123"
+        assert "success" in result.content
+        mock_tool.ainvoke.assert_awaited_once_with({"arg1": "value1"})
+    
+    @patch('src.processing.executor.get_tool')
+    def test_process_tool_calls_async(self, mock_get_tool):
+        """Test async processing appends tool responses and the next AI response."""
+        mock_tool = Mock()
+        mock_tool.ainvoke = AsyncMock(side_effect=lambda args: args["value"])
+        mock_get_tool.return_value = mock_tool
+        
+        ai_message = Mock()
+        ai_message.tool_calls = [
+            {"name": "test_tool", "args": {"value": "a"}, "id": "call_1"},
+            {"name": "test_tool", "args": {"value": "b"}, "id": "call_2"},
+        ]
+        llm = Mock()
+        llm.ainvoke = AsyncMock(return_value=AIMessage(content="done"))
+        
+        result = asyncio.run(process_tool_calls_async([ai_message], llm))
+        
+        assert [m.content for m in result[1:3]] == ["a", "b"]
+        assert result[-1].content == "done"
+
+    @patch('src.processing.executor.get_tool')
+    def test_astream_recursive_chain(self, mock_get_tool):
+        """Test streaming yields text chunks and runs tool calls between turns."""
+        mock_tool = Mock()
+        mock_tool.ainvoke = AsyncMock(return_value="tool output")
+        mock_get_tool.return_value = mock_tool
+        
+        turns = [
+            [AIMessageChunk(content="", tool_calls=[
+                {"name": "test_tool", "args": {}, "id": "call_1"}
+            ])],
+            [AIMessageChunk(content="Hello"), AIMessageChunk(content=" world")],
+        ]
+        
+        async def _astream(messages):
+            for chunk in turns.pop(0):
+                yield chunk
+        
+        llm = Mock()
+        llm.astream = _astream
+        messages = [HumanMessage(content="query")]
+        
+        async def _collect():
+            return [text async for text in astream_recursive_chain(messages, llm)]
+        
+        assert asyncio.run(_collect()) == ["Hello", " world"]
+        assert messages[2].content == "tool output"
+        assert messages[-1].content == "Hello world"
+
+
 class TestShouldContinue:
     """Tests for should_continue function."""
     
@@ -62,3 +293,10 @@ class TestShouldContinue:
     def test_should_continue_empty_messages(self):
         """Test should_continue with empty messages."""
         assert should_continue([]) is False
+
+    def test_should_continue_with_ai_messages(self):
+        """Test should_continue reads tool calls from real AI messages."""
+        call = {"name": "test_tool", "args": {}, "id": "call_1"}
+        assert should_continue([AIMessage(content="", tool_calls=[call])]) is True
+        assert should_continue([AIMessage(content="done")]) is False
+        assert should_continue([HumanMessage(content="hi")]) is False
@@ -21,6 +21,12 @@ class TestToolRegistry:
         assert len(tools) > 0
         assert all(isinstance(tool, BaseTool) for tool in tools)
     
+    def test_registry_keys_match_tool_names(self):
+        """Test each tool is registered exactly once under its own name."""
+        tools = get_all_tools()
+        assert all(name == tool.name for name, tool in TOOL_REGISTRY.items())
+        assert len({tool.name for tool in tools}) == len(tools)
+    
     def test_get_tool_exists(self):
         """Test getting an existing tool."""
         tool = get_tool("extract_video_id")
@@ -1,28 +1,38 @@
 """Unit tests for YouTube tools."""
 
+import orjson
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, VideoUnavailable
 
 from src.tools.youtube import (
     extract_video_id,
+    extract_video_ids,
     fetch_transcript,
+    fetch_transcripts_bulk,
     search_youtube,
     get_full_metadata,
+    get_full_metadata_bulk,
     get_thumbnails,
+    get_thumbnails_bulk,
     get_channel_info,
     get_playlist_info,
     get_playlist_videos,
+    get_playlist_metadata,
     fetch_transcript_with_timestamps,
     list_transcript_languages,
     _format_upload_date,
     _extract_info_with_ytdlp,
+    PlaylistEntry,
 )
+from src.core.models import VideoSearchResult
 from src.utils.exceptions import (
     InvalidVideoURLError,
     TranscriptNotFoundError,
     VideoNotFoundError,
     ToolExecutionError,
 )
+from src.utils.serialization import dumps_json
 
 
 class TestExtractVideoID:
@@ -52,6 +62,107 @@ class TestExtractVideoID:
         with pytest.raises(InvalidVideoURLError):
             extract_video_id.invoke({"url": url})
 
+    def test_overlong_video_id_raises_error(self):
+        """Test an ID-like token longer than 11 characters is not truncated."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQXYZ"
+        with pytest.raises(InvalidVideoURLError):
+            extract_video_id.invoke({"url": url})
+
+    def test_repeated_url_is_memoized(self):
+        """Test parsing the same URL twice reuses the memoized lookup."""
+        import src.tools.youtube as youtube
+
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        youtube._find_video_id.cache_clear()
+        extract_video_id.invoke({"url": url})
+        extract_video_id.invoke({"url": url})
+        assert youtube._find_video_id.cache_info().hits == 1
+
+    def test_canonical_url_skips_regex(self, monkeypatch):
+        """Test canonical URLs are sliced directly and other forms fall back to the regex."""
+        import src.tools.youtube as youtube
+
+        regex = Mock(wraps=youtube._VIDEO_ID_RE)
+        monkeypatch.setattr(youtube, "_VIDEO_ID_RE", regex)
+        monkeypatch.setattr(youtube, "_HS_DB", None)
+
+        assert extract_video_id.invoke({"url": "https://youtu.be/dQw4w9WgXcQ?t=1"}) == "dQw4w9WgXcQ"
+        regex.search.assert_not_called()
+        assert extract_video_id.invoke({"url": "https://www.youtube.com/embed/dQw4w9WgXcQ"}) == "dQw4w9WgXcQ"
+        regex.search.assert_called_once()
+
+    def test_id_followed_by_query_string(self):
+        """Test an ID followed by further query parameters is extracted."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42s"
+        assert extract_video_id.invoke({"url": url}) == "dQw4w9WgXcQ"
+    
+    def test_non_youtube_url_with_id_shape_raises_error(self):
+        """Test a non-YouTube URL is rejected even if it carries an ID-shaped value."""
+        url = "https://example.com/watch?v=dQw4w9WgXcQ"
+        with pytest.raises(InvalidVideoURLError):
+            extract_video_id.invoke({"url": url})
+
+
+class TestExtractVideoIDs:
+    """Tests for extract_video_ids tool."""
+    
+    def test_extract_from_mixed_urls(self):
+        """Test extracting video IDs from several URL formats at once."""
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/9bZkp7q19f0",
+            "https://www.youtube.com/embed/kJQP7kiw5Fk",
+        ]
+        result = extract_video_ids.invoke({"urls": urls})
+        assert result == ["dQw4w9WgXcQ", "9bZkp7q19f0", "kJQP7kiw5Fk"]
+    
+    def test_invalid_urls_are_none(self):
+        """Test that URLs without a video ID yield None in their position."""
+        urls = [
+            "https://example.com/not-youtube",
+            "https://example.com/watch?v=kJQP7kiw5Fk",
+            "https://youtu.be/dQw4w9WgXcQ",
+        ]
+        result = extract_video_ids.invoke({"urls": urls})
+        assert result == [None, None, "dQw4w9WgXcQ"]
+    
+    def test_one_entry_per_url(self):
+        """Test URLs with no ID or several v= parameters keep results aligned with inputs."""
+        urls = [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/channel/UC38IQsAvIsxxjztdMZQtwHA",
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa&v=bbbbbbbbbbb",
+        ]
+        result = extract_video_ids.invoke({"urls": urls})
+        assert result == ["dQw4w9WgXcQ", None, "aaaaaaaaaaa"]
+    
+    def test_empty_list(self):
+        """Test that an empty list returns no IDs."""
+        assert extract_video_ids.invoke({"urls": []}) == []
+    
+    def test_hyperscan_path_matches_re(self, monkeypatch):
+        """Test the Hyperscan scan path slices IDs from match end offsets."""
+        import re
+        import src.tools.youtube as youtube
+        
+        class FakeDatabase:
+            """Reports match end offsets the way hyperscan.Database.scan does."""
+            def scan(self, data, match_event_handler):
+                for m in re.finditer(youtube.YouTubeConfig.VIDEO_ID_SCAN_PATTERN.encode(), data):
+                    if match_event_handler(0, m.start(), m.end(), 0, None):
+                        break
+        
+        monkeypatch.setattr(youtube, "_HS_DB", FakeDatabase())
+        urls = [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://example.com",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQXYZ",
+            "https://www.youtube.com/embed/kJQP7kiw5Fk",
+        ]
+        
+        assert extract_video_ids.invoke({"urls": urls}) == ["dQw4w9WgXcQ", None, None, "kJQP7kiw5Fk"]
+        assert extract_video_id.invoke({"url": urls[0]}) == "dQw4w9WgXcQ"
+
 
 class TestFetchTranscript:
     """Tests for fetch_transcript tool."""
@@ -70,34 +181,181 @@ class TestFetchTranscript:
         result = fetch_transcript.invoke({"video_id": "test123", "language": "en"})
         assert "Hello world" in result
     
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_fetch_transcript_is_cached(self, mock_api_class):
+        """Test a repeated fetch for the same video and language skips the API."""
+        mock_api = Mock()
+        mock_snippet = Mock()
+        mock_snippet.text = "Hello world"
+        mock_api.fetch.return_value = Mock(snippets=[mock_snippet])
+        mock_api_class.return_value = mock_api
+        
+        for _ in range(2):
+            assert fetch_transcript.invoke({"video_id": "test123", "language": "en"}) == "Hello world"
+        assert mock_api.fetch.call_count == 1
+    
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_fetch_transcript_force_refresh(self, mock_api_class):
+        """Test force_refresh bypasses a cached transcript and replaces it."""
+        mock_api = Mock()
+        mock_api.fetch.side_effect = [
+            Mock(snippets=[Mock(text="old")]),
+            Mock(snippets=[Mock(text="new")]),
+        ]
+        mock_api_class.return_value = mock_api
+        
+        assert fetch_transcript.invoke({"video_id": "test123"}) == "old"
+        assert fetch_transcript.invoke({"video_id": "test123", "force_refresh": True}) == "new"
+        assert fetch_transcript.invoke({"video_id": "test123"}) == "new"
+        assert mock_api.fetch.call_count == 2
+    
     @patch('src.tools.youtube.YouTubeTranscriptApi')
     def test_fetch_transcript_not_found(self, mock_api_class):
         """Test transcript not found error."""
         mock_api = Mock()
-        mock_api.fetch.side_effect = Exception("No transcripts were found")
+        mock_api.fetch.side_effect = TranscriptsDisabled("test123")
         mock_api_class.return_value = mock_api
         
         with pytest.raises(TranscriptNotFoundError):
             fetch_transcript.invoke({"video_id": "test123"})
+    
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_missing_transcript_is_negatively_cached(self, mock_api_class):
+        """Test a retry after a missing transcript fails without another fetch."""
+        mock_api = Mock()
+        mock_api.fetch.side_effect = [TranscriptsDisabled("test123"), Mock(snippets=[Mock(text="late")])]
+        mock_api_class.return_value = mock_api
+        
+        for _ in range(2):
+            with pytest.raises(TranscriptNotFoundError, match="No transcript available"):
+                fetch_transcript.invoke({"video_id": "test123"})
+        assert mock_api.fetch.call_count == 1
+        assert fetch_transcript.invoke({"video_id": "test123", "force_refresh": True}) == "late"
+    
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_fetch_transcript_unavailable_video(self, mock_api_class):
+        """Test an unavailable video maps to VideoNotFoundError."""
+        mock_api_class.return_value.fetch.side_effect = VideoUnavailable("test123")
+        
+        with pytest.raises(VideoNotFoundError):
+            fetch_transcript.invoke({"video_id": "test123"})
+    
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_fetch_transcript_other_failure(self, mock_api_class):
+        """Test unrelated failures are not mistaken for a missing transcript."""
+        mock_api_class.return_value.fetch.side_effect = Exception("TranscriptsDisabled lookalike")
+        
+        with pytest.raises(ToolExecutionError):
+            fetch_transcript.invoke({"video_id": "test123"})
+    
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_fetch_transcript_async_runs_on_fanout_executor(self, mock_api_class):
+        """Test ainvoke fetches on the dedicated fan-out threads and shares the cache."""
+        import asyncio
+        import threading
+        
+        threads = []
+        
+        def fetch(video_id, languages):
+            threads.append(threading.current_thread().name)
+            return Mock(snippets=[Mock(text="Hello")])
+        
+        mock_api_class.return_value.fetch.side_effect = fetch
+        
+        result = asyncio.run(fetch_transcript.ainvoke({"video_id": "test123", "language": "en"}))
+        
+        assert result == "Hello"
+        assert threads[0].startswith("yt-fanout")
+        assert fetch_transcript.invoke({"video_id": "test123", "language": "en"}) == "Hello"
+        assert len(threads) == 1
+    
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_fetch_transcript_reuses_api_client(self, mock_api_class):
+        """Test transcript fetches share a single API client."""
+        mock_api = Mock()
+        mock_api.fetch.return_value = Mock(snippets=[Mock(text="Hello")])
+        mock_api_class.return_value = mock_api
+        
+        fetch_transcript.invoke({"video_id": "test123", "language": "en"})
+        fetch_transcript.invoke({"video_id": "test456", "language": "en"})
+        assert mock_api_class.call_count == 1
+
+
+class TestFetchTranscriptsBulk:
+    """Tests for fetch_transcripts_bulk tool."""
+    
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_fetches_in_order_and_reports_errors(self, mock_api_class, monkeypatch):
+        """Test results keep input order, 429s are retried and failures are reported."""
+        import src.tools.youtube as youtube
+        
+        monkeypatch.setattr(youtube.YouTubeConfig, "RATE_LIMIT_BACKOFF_SECONDS", 0)
+        failures = {
+            "vid1": [Exception("HTTP Error 429: Too Many Requests")],
+            "vid2": [TranscriptsDisabled("vid2")],
+        }
+        
+        def fetch(video_id, languages):
+            if failures.get(video_id):
+                raise failures[video_id].pop(0)
+            return Mock(snippets=[Mock(text=f"Text {video_id}")])
+        
+        mock_api_class.return_value.fetch.side_effect = fetch
+        
+        result = fetch_transcripts_bulk.invoke({"video_ids": ["vid1", "vid2", "vid3"]})
+        
+        assert [item['video_id'] for item in result] == ["vid1", "vid2", "vid3"]
+        assert result[0]['transcript'] == "Text vid1"
+        assert "No transcript available" in result[1]['error']
+        assert result[2]['transcript'] == "Text vid3"
+    
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_async_invocation_gathers_on_callers_loop(self, mock_api_class):
+        """Test ainvoke gathers the fetches directly on the running event loop."""
+        import asyncio
+        
+        mock_api_class.return_value.fetch.side_effect = (
+            lambda video_id, languages: Mock(snippets=[Mock(text=f"Text {video_id}")])
+        )
+        
+        run = asyncio.run
+        # Patching asyncio.run on the module patches it everywhere, so the
+        # test drives its own loop through the saved reference
+        with patch('src.tools.youtube.asyncio.run') as mock_run:
+            result = run(fetch_transcripts_bulk.ainvoke({"video_ids": ["vid1", "vid2"]}))
+        
+        mock_run.assert_not_called()
+        assert [item['transcript'] for item in result] == ["Text vid1", "Text vid2"]
 
 
 class TestSearchYouTube:
     """Tests for search_youtube tool."""
     
-    @patch('src.tools.youtube.youtube_search')
+    @patch('src.tools.youtube._extract_info_uncached')
     def test_search_youtube_success(self, mock_search):
         """Test successful YouTube search."""
-        mock_result = Mock()
-        mock_result.title = "Test Video"
-        mock_result.video_id = "test123"
-        mock_search.return_value.results = [mock_result]
+        mock_search.return_value = {'entries': [{'title': "Test Video", 'id': "test123"}]}
         
         result = search_youtube.invoke({"query": "test query"})
         assert len(result) == 1
-        assert result[0]["title"] == "Test Video"
-        assert result[0]["video_id"] == "test123"
+        assert result[0].title == "Test Video"
+        assert result[0].video_id == "test123"
+        assert result[0].url == "https://youtu.be/test123"
+        mock_search.assert_called_once_with("ytsearch20:test query", flat=True)
+    
+    @patch('src.tools.youtube._extract_info_uncached')
+    def test_search_hits_serialize_as_objects(self, mock_search):
+        """Test search hits are VideoSearchResult models that render as JSON objects."""
+        mock_search.return_value = {'entries': [{'title': "Test Video", 'id': "test123"}, {'id': "untitled"}]}
+        
+        result = search_youtube.invoke({"query": "test query"})
+        assert all(isinstance(hit, VideoSearchResult) for hit in result)
+        assert orjson.loads(dumps_json(result)) == [
+            {"title": "Test Video", "video_id": "test123", "url": "https://youtu.be/test123"},
+            {"title": None, "video_id": "untitled", "url": "https://youtu.be/untitled"},
+        ]
     
-    @patch('src.tools.youtube.youtube_search')
+    @patch('src.tools.youtube._extract_info_uncached')
     def test_search_youtube_error(self, mock_search):
         """Test YouTube search error handling."""
         mock_search.side_effect = Exception("Search failed")
@@ -150,6 +408,42 @@ class TestGetThumbnails:
         assert result[0]['url'] == 'http://example.com/thumb.jpg'
 
 
+class TestBulkExtraction:
+    """Tests for get_full_metadata_bulk and get_thumbnails_bulk tools."""
+    
+    @staticmethod
+    def _extract(url):
+        if url.endswith("bad"):
+            raise VideoNotFoundError("Video not found")
+        return {
+            'title': f"Title {url[-1]}",
+            'thumbnails': [{'url': f"http://example.com/{url[-1]}.jpg", 'width': 1, 'height': 2}],
+        }
+    
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_metadata_bulk_keeps_order_and_reports_errors(self, mock_extract):
+        """Test metadata results follow input order with failures reported inline."""
+        mock_extract.side_effect = self._extract
+        
+        result = get_full_metadata_bulk.invoke({"urls": ["u1", "ubad", "u2"]})
+
+        assert [item.get('title') for item in result] == ["Title 1", None, "Title 2"]
+        assert result[1] == {'url': "ubad", 'error': "Video not found"}
+
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_thumbnails_bulk_async(self, mock_extract):
+        """Test the async path returns thumbnails per URL."""
+        import asyncio
+
+        mock_extract.side_effect = self._extract
+
+        result = asyncio.run(get_thumbnails_bulk.ainvoke({"urls": ["u1", "ubad"]}))
+
+        assert result[0]['url'] == "u1"
+        assert result[0]['thumbnails'][0]['resolution'] == "1x2"
+        assert 'error' in result[1]
+
+
 class TestExtractVideoIDEdgeCases:
     """Additional edge-case tests for extract_video_id tool."""
 
@@ -180,6 +474,52 @@ class TestGetThumbnailsEdgeCases:
         result = get_thumbnails.invoke({"url": "https://youtube.com/watch?v=test"})
         assert result == []
 
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_get_thumbnails_without_resolution(self, mock_extract):
+        """Resolution strings are left out when not requested."""
+        mock_extract.return_value = {'thumbnails': [
+            {'url': 'http://example.com/a.jpg', 'width': 320, 'height': 180},
+        ]}
+
+        result = get_thumbnails.invoke({"url": "https://youtube.com/watch?v=test", "include_resolution": False})
+        assert result == [{'url': 'http://example.com/a.jpg', 'width': 320, 'height': 180}]
+
+    @patch('src.tools.youtube.SESSION')
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_get_thumbnails_verify_drops_unavailable(self, mock_extract, mock_session):
+        """With verify, thumbnails that do not answer 200 OK are dropped."""
+        import requests
+
+        mock_extract.return_value = {'thumbnails': [
+            {'url': 'http://example.com/ok.jpg'},
+            {'url': 'http://example.com/missing.jpg'},
+            {'url': 'http://example.com/down.jpg'},
+        ]}
+
+        def head(url, **kwargs):
+            if 'down' in url:
+                raise requests.ConnectionError("down")
+            return Mock(status_code=200 if 'ok' in url else 404)
+
+        mock_session.head.side_effect = head
+
+        result = get_thumbnails.invoke({"url": "https://youtube.com/watch?v=test", "verify": True})
+        assert [t['url'] for t in result] == ['http://example.com/ok.jpg']
+
+    @patch('src.tools.youtube.yt_dlp.YoutubeDL')
+    def test_get_thumbnails_resolution_needs_both_dimensions(self, mock_ydl_class):
+        """Resolution is only reported when width and height are both known."""
+        mock_ydl = MagicMock()
+        mock_ydl.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {'thumbnails': [
+            {'url': 'http://example.com/a.jpg', 'width': 320, 'height': 180},
+            {'url': 'http://example.com/b.jpg', 'width': 320},
+        ]}
+        mock_ydl_class.return_value = mock_ydl
+
+        result = get_thumbnails.invoke({"url": "https://youtube.com/watch?v=test"})
+        assert [t['resolution'] for t in result] == ['320x180', None]
+
     @patch('src.tools.youtube.yt_dlp.YoutubeDL')
     def test_get_thumbnails_missing_thumbnails_key(self, mock_ydl_class):
         """Missing thumbnails key should return empty list."""
@@ -218,11 +558,21 @@ class TestFormatUploadDate:
         assert _format_upload_date("202312251") is None  # Too long
         assert _format_upload_date(None) is None
         assert _format_upload_date("") is None
+        assert _format_upload_date("2023122²") is None  # Non-ASCII digit
+        assert _format_upload_date("٢٠٢٣١٢٢٥") is None  # Arabic-Indic digits
 
     def test_format_invalid_date_value_returns_none(self):
         """Test that invalid date value returns None."""
         assert _format_upload_date("20231301") is None  # Invalid month
         assert _format_upload_date("20231232") is None  # Invalid day
+        assert _format_upload_date("20230229") is None  # Not a leap year
+        assert _format_upload_date("20231200") is None  # Day zero
+        assert _format_upload_date("00000101") is None  # Year zero
+
+    def test_format_leap_day(self):
+        """Test February 29th is accepted in leap years only."""
+        assert _format_upload_date("20240229") == "2024-02-29"
+        assert _format_upload_date("19000229") is None
 
 
 class TestExtractInfoWithYtDlp:
@@ -262,6 +612,122 @@ class TestExtractInfoWithYtDlp:
         with pytest.raises(ToolExecutionError):
             _extract_info_with_ytdlp("https://youtube.com/watch?v=test")
 
+    @patch('src.tools.youtube.yt_dlp.YoutubeDL')
+    def test_extract_info_reuses_youtube_dl_instance(self, mock_ydl_class):
+        """Test sequential extractions share one pooled YoutubeDL instance."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {"title": "Test"}
+        mock_ydl_class.return_value = mock_ydl
+
+        _extract_info_with_ytdlp("https://youtube.com/watch?v=one")
+        _extract_info_with_ytdlp("https://youtube.com/watch?v=two")
+
+        assert mock_ydl_class.call_count == 1
+        assert mock_ydl.extract_info.call_count == 2
+
+    @patch('src.tools.youtube.yt_dlp.YoutubeDL')
+    def test_extract_info_uses_disk_cache(self, mock_ydl_class, tmp_path, monkeypatch):
+        """Test repeated extraction for a URL is served from the disk cache."""
+        import diskcache
+        import src.tools.youtube as youtube
+
+        cache = diskcache.Cache(str(tmp_path))
+        monkeypatch.setattr(youtube, "_get_info_cache", lambda: cache)
+        mock_ydl = MagicMock()
+        mock_ydl.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"title": "Test"}
+        mock_ydl_class.return_value = mock_ydl
+
+        url = "https://youtube.com/watch?v=test"
+        assert _extract_info_with_ytdlp(url) == {"title": "Test"}
+        # Drop the in-process layer so the second read has to hit the disk
+        youtube._INFO_MEMO.clear()
+        assert _extract_info_with_ytdlp(url) == {"title": "Test"}
+        assert mock_ydl.extract_info.call_count == 1
+
+        assert youtube.cache_invalidate(url) is True
+        _extract_info_with_ytdlp(url)
+        assert mock_ydl.extract_info.call_count == 2
+        cache.close()
+
+    @patch('src.tools.youtube.yt_dlp.YoutubeDL')
+    def test_videos_skip_processing(self, mock_ydl_class):
+        """Test videos are extracted without processing and other results are resolved."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.side_effect = lambda url, **kwargs: (
+            {'_type': 'playlist', 'entries': iter([])} if 'channel' in url
+            else {'title': 'Test', 'live_status': 'post_live'}
+        )
+        mock_ydl.process_ie_result.return_value = {'_type': 'playlist', 'entries': []}
+        mock_ydl_class.return_value = mock_ydl
+
+        info = _extract_info_with_ytdlp("https://youtube.com/watch?v=test")
+        assert (info['is_live'], info['was_live']) == (False, True)
+        mock_ydl.extract_info.assert_called_once_with(
+            "https://youtube.com/watch?v=test", download=False, process=False
+        )
+        mock_ydl.process_ie_result.assert_not_called()
+
+        assert _extract_info_with_ytdlp("https://youtube.com/channel/x") == {'_type': 'playlist', 'entries': []}
+        mock_ydl.process_ie_result.assert_called_once()
+
+    @patch('src.tools.youtube.yt_dlp.YoutubeDL')
+    def test_unprocessed_videos_get_dates_from_timestamps(self, mock_ydl_class):
+        """Test release and upload dates are derived from timestamps in UTC."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {
+            'title': 'Premiere',
+            'timestamp': 1704153600,  # 2024-01-02T00:00:00Z
+            'release_timestamp': 1704153599,  # 2024-01-01T23:59:59Z
+        }
+        mock_ydl_class.return_value = mock_ydl
+
+        metadata = get_full_metadata.invoke({"url": "https://youtube.com/watch?v=test"})
+
+        assert metadata['upload_date_raw'] == '20240102'
+        assert metadata['release_date'] == '2024-01-01'
+
+    @patch('src.tools.youtube.yt_dlp.YoutubeDL')
+    def test_tools_share_one_extraction_per_url(self, mock_ydl_class):
+        """Test metadata, channel and thumbnail tools reuse one in-process extraction."""
+        import src.tools.youtube as youtube
+
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {
+            'title': 'Test', 'channel': 'Channel',
+            'thumbnails': [{'url': 'http://example.com/thumb.jpg'}],
+        }
+        mock_ydl_class.return_value = mock_ydl
+
+        url = "https://youtube.com/watch?v=test"
+        get_full_metadata.invoke({"url": url})
+        get_channel_info.invoke({"url": url})
+        get_thumbnails.invoke({"url": url})
+        assert mock_ydl.extract_info.call_count == 1
+
+        assert youtube.cache_invalidate(url) is True
+        get_thumbnails.invoke({"url": url})
+        assert mock_ydl.extract_info.call_count == 2
+
+    @patch('src.tools.youtube.yt_dlp.YoutubeDL')
+    def test_in_process_info_expires(self, mock_ydl_class, monkeypatch):
+        """Test memoized info is extracted again once its TTL has passed."""
+        from cachetools import TTLCache
+        import src.tools.youtube as youtube
+
+        clock = [0.0]
+        monkeypatch.setattr(youtube, "_INFO_MEMO", TTLCache(maxsize=8, ttl=60, timer=lambda: clock[0]))
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {"title": "Test"}
+        mock_ydl_class.return_value = mock_ydl
+
+        url = "https://youtube.com/watch?v=test"
+        _extract_info_with_ytdlp(url)
+        _extract_info_with_ytdlp(url)
+        clock[0] = 61.0
+        _extract_info_with_ytdlp(url)
+        assert mock_ydl.extract_info.call_count == 2
+
 
 class TestGetFullMetadataEnhanced:
     """Enhanced tests for get_full_metadata tool."""
@@ -356,34 +822,307 @@ class TestGetFullMetadataEnhanced:
             get_full_metadata.invoke({"url": "https://youtube.com/watch?v=test"})
 
 
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_get_metadata_defaults_for_missing_fields(self, mock_extract):
+        """Test missing fields fall back to their defaults with fresh lists."""
+        mock_extract.return_value = {'upload_date': '20231225'}
+
+        first = get_full_metadata.invoke({"url": "https://youtube.com/watch?v=one"})
+        second = get_full_metadata.invoke({"url": "https://youtube.com/watch?v=two"})
+
+        assert first['upload_date'] == '2023-12-25'
+        assert first['upload_date_raw'] == '20231225'
+        assert (first['is_live'], first['was_live'], first['title']) == (False, False, None)
+        assert first['tags'] == [] and first['tags'] is not second['tags']
+
+
 class TestSearchYouTubeEnhanced:
     """Tests for enhanced search_youtube with max_results."""
 
-    @patch('src.tools.youtube.youtube_search')
+    @patch('src.tools.youtube._extract_info_uncached')
     def test_search_with_max_results(self, mock_search):
         """Test search with max_results parameter."""
-        mock_results = [Mock(title=f"Video {i}", video_id=f"id{i}") for i in range(10)]
-        mock_search.return_value.results = mock_results
+        mock_search.return_value = {'entries': [{'title': f"Video {i}", 'id': f"id{i}"} for i in range(10)]}
 
         result = search_youtube.invoke({"query": "test", "max_results": 3})
         assert len(result) == 3
-        assert result[0]["title"] == "Video 0"
-        assert result[2]["title"] == "Video 2"
+        assert result[0].title == "Video 0"
+        assert result[2].title == "Video 2"
+        mock_search.assert_called_once_with("ytsearch3:test", flat=True)
 
-    @patch('src.tools.youtube.youtube_search')
+    @patch('src.tools.youtube._extract_info_uncached')
     def test_search_without_max_results(self, mock_search):
-        """Test search without max_results returns all results."""
-        mock_results = [Mock(title=f"Video {i}", video_id=f"id{i}") for i in range(5)]
-        mock_search.return_value.results = mock_results
+        """Test search without max_results returns every search result."""
+        mock_search.return_value = {'entries': [{'title': f"Video {i}", 'id': f"id{i}"} for i in range(5)]}
 
         result = search_youtube.invoke({"query": "test"})
         assert len(result) == 5
 
-    @patch('src.tools.youtube.youtube_search')
+    @patch('src.tools.youtube._extract_info_uncached')
     def test_search_with_zero_max_results(self, mock_search):
         """Test search with max_results=0 returns empty list."""
-        mock_results = [Mock(title="Video", video_id="id") for _ in range(5)]
-        mock_search.return_value.results = mock_results
 
         result = search_youtube.invoke({"query": "test", "max_results": 0})
         assert result == []
+        mock_search.assert_not_called()
+
+
+class TestGetPlaylistVideos:
+    """Tests for get_playlist_videos provider racing."""
+
+    def test_pytube_listing_is_not_remembered(self):
+        """Test a pytube fallback listing never pins later calls to pytube."""
+        import src.tools.youtube as youtube
+
+        ytdlp = Mock(return_value=[])
+        entry = PlaylistEntry(title='ABC', video_id='abc', url=None, position=1)
+        pytube = Mock(return_value=[entry])
+        url = "https://youtube.com/playlist?list=PL1"
+
+        with patch.dict(youtube._PLAYLIST_PROVIDERS, {"yt-dlp": ytdlp, "pytube": pytube}):
+            assert get_playlist_videos.invoke({"url": url}) == [entry]
+            assert get_playlist_videos.invoke({"url": url}) == [entry]
+
+        assert url not in youtube._PLAYLIST_WINNERS
+        assert ytdlp.call_count == 2
+        assert pytube.call_count == 2
+
+    def test_ytdlp_listing_is_remembered(self):
+        """Test a yt-dlp listing is cached and later calls skip the race."""
+        import src.tools.youtube as youtube
+
+        entry = PlaylistEntry(title='ABC', video_id='abc', url=None, position=1)
+        ytdlp = Mock(return_value=[entry])
+        pytube = Mock(return_value=[entry])
+        url = "https://youtube.com/playlist?list=PL1"
+
+        with patch.dict(youtube._PLAYLIST_PROVIDERS, {"yt-dlp": ytdlp, "pytube": pytube}):
+            assert get_playlist_videos.invoke({"url": url}) == [entry]
+            assert get_playlist_videos.invoke({"url": url}) == [entry]
+
+        assert youtube._PLAYLIST_WINNERS[url] == "yt-dlp"
+        assert ytdlp.call_count == 2
+        pytube.assert_not_called()
+
+    def test_failing_remembered_provider_falls_back_to_race(self):
+        """Test a remembered provider that raises falls through to the provider race."""
+        import src.tools.youtube as youtube
+
+        entry = PlaylistEntry(title='ABC', video_id='abc', url=None, position=1)
+        ytdlp = Mock(return_value=[entry])
+        pytube = Mock(side_effect=Exception("pytube broke"))
+        url = "https://youtube.com/playlist?list=PL1"
+        youtube._PLAYLIST_WINNERS[url] = "pytube"
+
+        with patch.dict(youtube._PLAYLIST_PROVIDERS, {"yt-dlp": ytdlp, "pytube": pytube}):
+            assert get_playlist_videos.invoke({"url": url}) == [entry]
+
+        assert youtube._PLAYLIST_WINNERS[url] == "yt-dlp"
+
+    def test_pytube_is_not_started_when_ytdlp_delivers(self):
+        """Test a prompt yt-dlp listing never starts the pytube crawl."""
+        import src.tools.youtube as youtube
+
+        entry = PlaylistEntry(title='ABC', video_id='abc', url=None, position=1)
+        ytdlp = Mock(return_value=[entry])
+        pytube = Mock(return_value=[entry])
+
+        with patch.dict(youtube._PLAYLIST_PROVIDERS, {"yt-dlp": ytdlp, "pytube": pytube}):
+            assert get_playlist_videos.invoke({"url": "https://youtube.com/playlist?list=PL1"}) == [entry]
+
+        pytube.assert_not_called()
+
+    def test_pytube_hedges_a_slow_ytdlp(self, monkeypatch):
+        """Test pytube starts once yt-dlp exceeds the fallback delay, and can win."""
+        import threading
+        import src.tools.youtube as youtube
+
+        monkeypatch.setattr(youtube.YouTubeConfig, "PLAYLIST_FALLBACK_DELAY_SECONDS", 0.01)
+        release = threading.Event()
+        entry = PlaylistEntry(title='ABC', video_id='abc', url=None, position=1)
+
+        def slow_ytdlp(url):
+            release.wait(5)
+            return []
+
+        pytube = Mock(return_value=[entry])
+        url = "https://youtube.com/playlist?list=PL1"
+        try:
+            with patch.dict(youtube._PLAYLIST_PROVIDERS, {"yt-dlp": slow_ytdlp, "pytube": pytube}):
+                assert get_playlist_videos.invoke({"url": url}) == [entry]
+        finally:
+            release.set()
+        assert url not in youtube._PLAYLIST_WINNERS
+
+    @patch('src.tools.youtube.Playlist')
+    def test_pytube_crawl_is_capped(self, mock_playlist, monkeypatch):
+        """Test the pytube fallback stops after PLAYLIST_FALLBACK_MAX_VIDEOS videos."""
+        from itertools import count
+        import src.tools.youtube as youtube
+
+        monkeypatch.setattr(youtube.YouTubeConfig, "PLAYLIST_FALLBACK_MAX_VIDEOS", 3)
+        mock_playlist.return_value.videos = (
+            Mock(title=f"Video {i}", video_id=f"id{i}", watch_url=f"https://youtu.be/id{i}") for i in count()
+        )
+
+        assert [v.position for v in youtube._playlist_videos_pytube("https://youtube.com/playlist?list=PL1")] == [1, 2, 3]
+
+    def test_ytdlp_error_is_raised_when_no_provider_delivers(self):
+        """Test a yt-dlp failure propagates when pytube finds nothing."""
+        import src.tools.youtube as youtube
+
+        ytdlp = Mock(side_effect=VideoNotFoundError("Content not found"))
+        pytube = Mock(side_effect=Exception("pytube broke"))
+
+        with patch.dict(youtube._PLAYLIST_PROVIDERS, {"yt-dlp": ytdlp, "pytube": pytube}):
+            with pytest.raises(VideoNotFoundError):
+                get_playlist_videos.invoke({"url": "https://youtube.com/playlist?list=PL1"})
+
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_ytdlp_lists_flat_and_promotes_on_request(self, mock_extract):
+        """Test the yt-dlp listing is flat and details are resolved only on request."""
+        import src.tools.youtube as youtube
+
+        def extract(url, flat=False):
+            if flat:
+                return {'entries': [{'id': 'vid00000001', 'title': 'One',
+                                     'url': 'https://www.youtube.com/watch?v=vid00000001'}]}
+            return {'title': 'One', 'duration': 61, 'uploader': 'Channel'}
+        mock_extract.side_effect = extract
+        empty = Mock(return_value=[])
+        url = "https://youtube.com/playlist?list=PL1"
+
+        with patch.dict(youtube._PLAYLIST_PROVIDERS, {"pytube": empty}):
+            listing = get_playlist_videos.invoke({"url": url})
+            detailed = get_playlist_videos.invoke({"url": url, "include_details": True})
+
+        assert listing[0].duration is None
+        assert orjson.loads(dumps_json(listing))[0]['video_id'] == 'vid00000001'
+        assert (detailed[0].duration, detailed[0].channel) == (61, 'Channel')
+        assert [c.kwargs.get('flat', False) for c in mock_extract.call_args_list] == [True, True, False]
+
+    def test_empty_playlist_returns_empty_list(self):
+        """Test an empty listing from every provider returns an empty list."""
+        import src.tools.youtube as youtube
+
+        empty = Mock(return_value=[])
+        with patch.dict(youtube._PLAYLIST_PROVIDERS, {"yt-dlp": empty, "pytube": empty}):
+            assert get_playlist_videos.invoke({"url": "https://youtube.com/playlist?list=PL1"}) == []
+
+
+class TestGetPlaylistMetadata:
+    """Tests for get_playlist_metadata tool."""
+
+    @staticmethod
+    def _fake_extract(failures=None):
+        failures = failures or {}
+
+        def extract(url, flat=False):
+            if flat:
+                return {'entries': [{'id': 'vid00000001'}, None, {'id': 'vid00000002'}]}
+            video_id = url.rsplit('=', 1)[1]
+            if failures.get(video_id):
+                raise failures[video_id].pop(0)
+            return {'title': f"Title {video_id}"}
+        return extract
+
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_fetches_every_entry_in_order(self, mock_extract):
+        """Test every playlist entry is resolved and positioned in order."""
+        mock_extract.side_effect = self._fake_extract()
+
+        result = get_playlist_metadata.invoke({"url": "https://youtube.com/playlist?list=PL1"})
+
+        assert [item['title'] for item in result] == ["Title vid00000001", "Title vid00000002"]
+        assert [item['position'] for item in result] == [1, 2]
+
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_retries_rate_limited_videos(self, mock_extract, monkeypatch):
+        """Test HTTP 429 failures are retried and other failures are reported."""
+        import src.tools.youtube as youtube
+
+        monkeypatch.setattr(youtube.YouTubeConfig, "RATE_LIMIT_BACKOFF_SECONDS", 0)
+        mock_extract.side_effect = self._fake_extract({
+            'vid00000001': [ToolExecutionError("HTTP Error 429: Too Many Requests")],
+            'vid00000002': [ToolExecutionError("Video unavailable")],
+        })
+
+        result = get_playlist_metadata.invoke({"url": "https://youtube.com/playlist?list=PL1"})
+
+        assert result[0]['title'] == "Title vid00000001"
+        assert "Video unavailable" in result[1]['error']
+
+    def test_rate_limit_detection(self):
+        """Test 429s are recognised from HTTP statuses, not from IDs containing 429."""
+        from yt_dlp.networking.exceptions import HTTPError
+        from yt_dlp.utils import DownloadError, ExtractorError
+        import src.tools.youtube as youtube
+
+        response = Mock(status=429, reason="Too Many Requests", headers={}, url="https://youtu.be/x")
+        http_error = HTTPError(response)
+        extractor_error = ExtractorError("Unable to download webpage", cause=http_error)
+        download_error = DownloadError("ERROR: Unable to download webpage", exc_info=(ExtractorError, extractor_error, None))
+        try:
+            raise ToolExecutionError("Failed to extract info") from download_error
+        except ToolExecutionError as e:
+            assert youtube._is_rate_limited(e)
+
+        assert not youtube._is_rate_limited(
+            ToolExecutionError("Failed to extract info for https://youtu.be/abc429defgh: Video unavailable")
+        )
+
+    @patch('src.tools.youtube._extract_info_with_ytdlp')
+    def test_unavailable_video_with_429_in_id_is_not_retried(self, mock_extract, monkeypatch):
+        """Test a plain failure for an ID containing 429 is reported without retries."""
+        import src.tools.youtube as youtube
+
+        monkeypatch.setattr(youtube.YouTubeConfig, "RATE_LIMIT_BACKOFF_SECONDS", 0)
+        mock_extract.side_effect = ToolExecutionError(
+            "Failed to extract info for https://youtu.be/abc429defgh: Video unavailable"
+        )
+
+        result = get_full_metadata_bulk.invoke({"urls": ["https://youtu.be/abc429defgh"]})
+
+        assert "Video unavailable" in result[0]['error']
+        assert mock_extract.call_count == 1
+
+
+class TestFetchTranscriptWithTimestamps:
+    """Tests for fetch_transcript_with_timestamps tool."""
+
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_falls_back_to_first_available_transcript(self, mock_api_class):
+        """Test a missing language falls back to the first listed transcript."""
+        fallback = Mock()
+        fallback.fetch.return_value = [Mock(text="Hallo", start=0.0, duration=1.5)]
+        transcript_list = MagicMock()
+        transcript_list.find_transcript.side_effect = NoTranscriptFound("test123", ["en"], [])
+        transcript_list.__iter__.return_value = iter([fallback])
+        mock_api_class.return_value.list.return_value = transcript_list
+
+        result = fetch_transcript_with_timestamps.invoke({"video_id": "test123", "language": "en"})
+
+        assert result == [{'text': "Hallo", 'start': 0.0, 'duration': 1.5}]
+
+
+class TestListTranscriptLanguages:
+    """Tests for list_transcript_languages tool."""
+
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_lists_manual_then_generated(self, mock_api_class):
+        """Test languages are reported in transcript list order with their origin."""
+        manual = Mock(language_code='en', language='English', is_generated=False, is_translatable=True)
+        generated = Mock(language_code='de', language='German', is_generated=True, is_translatable=False)
+        mock_api_class.return_value.list.return_value = [manual, generated]
+
+        result = list_transcript_languages.invoke({"video_id": "test123"})
+
+        assert [(item['language_code'], item['is_generated']) for item in result] == [('en', False), ('de', True)]
+
+    @patch('src.tools.youtube.YouTubeTranscriptApi')
+    def test_disabled_transcripts_raise_not_found(self, mock_api_class):
+        """Test disabled transcripts map to TranscriptNotFoundError."""
+        mock_api_class.return_value.list.side_effect = TranscriptsDisabled("test123")
+
+        with pytest.raises(TranscriptNotFoundError):
+            list_transcript_languages.invoke({"video_id": "test123"})